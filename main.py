@@ -1,9 +1,8 @@
 """Entry point for ReadingRabbit application."""
 from __future__ import annotations
 
-import threading
 import tkinter as tk
-from threading import Event
+from threading import Event, Thread
 from typing import Optional
 
 from src.config import load_config
@@ -18,8 +17,6 @@ def main() -> None:
     logger = setup_logging(config.log_path, config.log_level)
     logger.info("Starting ReadingRabbit")
     stop_event = Event()
-    pause_event = Event()
-    monitor_thread: Optional[threading.Thread] = None
     monitor: Optional[ResourceMonitor] = None
     closing = False
 
@@ -30,16 +27,16 @@ def main() -> None:
         logger.warning("Resource alert: %s", message)
         gui.show_alert(message)
 
-    def toggle_monitor(active: bool) -> None:
-        if active:
-            pause_event.clear()
-        else:
-            pause_event.set()
+    def on_update(frame: Optional[object], progress: float, eta: float) -> None:
+        # Runs on the worker thread; the GUI keeps only the latest call per key.
+        gui.show_frame(frame)
+        gui.update_progress(progress)
+        gui.update_status_progress(progress)
+        gui.update_eta(eta)
 
     def start_processing() -> None:
-        nonlocal monitor_thread, monitor
+        nonlocal monitor
         stop_event.clear()
-        pause_event.clear()
         gui.prepare_for_run()
 
         if config.show_resource_usage:
@@ -47,8 +44,8 @@ def main() -> None:
                 update_callback=gui.update_resources,
                 interval=config.monitor_interval,
                 stop_event=stop_event,
-                pause_event=pause_event,
-                gpu_index=config.gpu_index if config.use_gpu else None,
+                active_event=gui.monitoring,
+                gpu_index=config.monitor_gpu_index,
                 log_path=config.resource_log_path,
                 alert_thresholds=config.resource_alerts,
                 alert_callback=handle_alert,
@@ -56,21 +53,16 @@ def main() -> None:
                 summary_path=config.resource_summary_path,
                 alert_log_path=config.resource_alert_history_path,
                 trend_window=config.analytics_trend_window,
+                log_ready_callback=gui.notify_resource_log_ready,
             )
-            monitor_thread = threading.Thread(target=monitor.run, daemon=True)
-            monitor_thread.start()
+            # Daemon, so a monitor stuck in a GPU query never blocks interpreter exit.
+            Thread(target=monitor.run, name="readingrabbit-monitor", daemon=True).start()
         else:
             monitor = None
-            monitor_thread = None
 
         processor = VideoProcessor(
             config=config,
-            update_callback=lambda frame, progress, eta: (
-                gui.show_frame(frame),
-                gui.update_progress(progress),
-                gui.update_status(f"Processing… {progress:.2f}%"),
-                gui.update_eta(eta),
-            ),
+            update_callback=on_update,
             stop_event=stop_event,
         )
 
@@ -93,9 +85,8 @@ def main() -> None:
             summary_text: Optional[str] = None
             summary_path: Optional[str] = None
             alert_log_path: Optional[str] = None
-            if monitor_thread and monitor_thread.is_alive():
-                monitor_thread.join(timeout=2.0)
             if monitor is not None:
+                monitor.done.wait(timeout=2.0)
                 summary_text = monitor.summary_text
                 summary_path = (
                     str(monitor.summary_path) if monitor.summary_path is not None else None
@@ -105,7 +96,6 @@ def main() -> None:
                     if monitor.alert_log_path is not None
                     else None
                 )
-            monitor_thread = None
             monitor = None
             if not closing:
                 if cancelled or already_cancelled:
@@ -115,13 +105,11 @@ def main() -> None:
                 if summary_text:
                     gui.show_summary(summary_text, summary_path, alert_log_path)
                 stop_event.clear()
-                pause_event.clear()
 
     gui = AppGUI(
         root,
         on_start=start_processing,
-        on_toggle_monitor=toggle_monitor if config.show_resource_usage else None,
-        theme=config.theme(),
+        theme=config.resolved_theme,
         show_resource_usage=config.show_resource_usage,
         history_seconds=config.resource_history_seconds,
         monitor_interval=config.monitor_interval,
@@ -131,15 +119,16 @@ def main() -> None:
         resource_alert_history_path=config.resource_alert_history_path,
         layout=config.ui_layout,
         scaling=config.ui_scaling,
+        preview_max_width=config.ui_preview_max_width,
     )
 
     def on_close() -> None:
-        nonlocal closing, monitor_thread
+        nonlocal closing
         closing = True
         stop_event.set()
-        pause_event.clear()
-        if monitor_thread and monitor_thread.is_alive():
-            monitor_thread.join(timeout=2.0)
+        active_monitor = monitor
+        if active_monitor is not None:
+            active_monitor.done.wait(timeout=2.0)
         logger.info("Shutting down ReadingRabbit")
         root.destroy()
 
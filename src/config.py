@@ -1,12 +1,26 @@
 """Configuration handling for ReadingRabbit."""
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import logging
+import os
+import pickle
+from collections import OrderedDict
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import Any, Dict, Mapping, Sequence
+from typing import Any, Callable, Dict, Mapping, Sequence
 
 import yaml
 
+try:
+    import tomllib
+except ModuleNotFoundError:  # Python < 3.11 has no stdlib TOML parser
+    tomllib = None  # type: ignore[assignment]
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # libyaml bindings are optional; fall back to pure Python
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 
 @dataclass(slots=True)
 class AppConfig:
@@ -17,10 +31,19 @@ class AppConfig:
     use_gpu: bool = True
     gpu_index: int = 0
     ocr_languages: list[str] = field(default_factory=lambda: ["en"])
+    ocr_batch_size: int = 8
+    ocr_workers: int = 1
+    ocr_max_side: int = 960
+    sample_fps: float = 2.0
+    decode_workers: int = 1
+    scene_change_threshold: int = 3
     prompt_template: str = "Correct the OCR text: {text}"
-    threads: int = 1
+    threads: int = 1  # capped to usable CPUs minus one for the GUI/monitor threads
     ui_theme: str = "dark"
     llm_model: str = ""
+    llm_quantize: bool = False
+    min_text_chars_for_llm: int = 4
+    min_ocr_confidence_for_llm: float = 0.4
     show_resource_usage: bool = True
     monitor_interval: float = 1.0
     resource_history_seconds: int = 120
@@ -33,15 +56,26 @@ class AppConfig:
     analytics_trend_window: float = 60.0
     ui_layout: str = "stacked"
     ui_scaling: float = 1.0
+    ui_preview_max_width: int = 640
     log_path: str | None = None
     log_level: str = "INFO"
     themes: Dict[str, Dict[str, Any]] = field(default_factory=dict)
     ocr_preprocessing: Dict[str, Dict[str, Any]] = field(default_factory=dict)
 
+    # Derived on access rather than in __post_init__, so later edits to the
+    # fields they read are never served stale.
+    @property
+    def resolved_theme(self) -> Mapping[str, Any] | None:
+        return self.themes.get(self.ui_theme)
+
+    @property
+    def monitor_gpu_index(self) -> int | None:
+        return self.gpu_index if self.use_gpu else None
+
     def theme(self) -> Mapping[str, Any] | None:
         """Return the theme mapping for the selected UI theme."""
 
-        return self.themes.get(self.ui_theme)
+        return self.resolved_theme
 
     def preprocessing_for(self, languages: Sequence[str]) -> Mapping[str, Any]:
         """Return preprocessing options for the preferred language."""
@@ -63,6 +97,12 @@ def _ensure_languages(value: Any) -> list[str]:
     return ["en"]
 
 
+def _lower_str(value: Any, default: str = "") -> str:
+    if value is None:
+        value = default
+    return value.lower() if type(value) is str else str(value).lower()
+
+
 def _ensure_float(value: Any, default: float, minimum: float | None = None) -> float:
     try:
         result = float(value)
@@ -81,74 +121,203 @@ def _normalise_alerts(alerts: Any) -> Dict[str, float]:
         if value is None:
             continue
         try:
-            normalised[str(key).lower()] = float(value)
+            normalised[_lower_str(key)] = float(value)
         except (TypeError, ValueError):
             continue
     return normalised
 
 
+def _available_cpus() -> int:
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # not available on Windows/macOS
+        return os.cpu_count() or 1
+
+
 def _ensure_path_str(value: Any) -> str | None:
     if value in (None, ""):
         return None
     return str(value)
 
 
+_BOOL_PREPROCESSING_KEYS = frozenset(
+    {
+        "grayscale",
+        "apply_to_easyocr",
+        "use_adaptive_threshold",
+        "use_otsu_threshold",
+        "fast_otsu",
+    }
+)
+_INT_PREPROCESSING_KEYS = frozenset(
+    {
+        "bilateral_diameter",
+        "bilateral_sigma_color",
+        "bilateral_sigma_space",
+        "adaptive_threshold_block_size",
+        "clahe_tile_grid_size",
+    }
+)
+_FLOAT_PREPROCESSING_KEYS = frozenset(
+    {
+        "clahe_clip_limit",
+        "adaptive_threshold_c",
+        "resize_scale",
+        "sharpen_amount",
+    }
+)
+_PREPROCESSING_CONVERTERS: Dict[str, Callable[[Any], Any]] = {
+    **dict.fromkeys(_BOOL_PREPROCESSING_KEYS, bool),
+    **dict.fromkeys(_INT_PREPROCESSING_KEYS, int),
+    **dict.fromkeys(_FLOAT_PREPROCESSING_KEYS, float),
+}
+
+
 def _normalise_preprocessing(config: Any) -> Dict[str, Dict[str, Any]]:
     if not isinstance(config, Mapping):
         return {}
 
+    converters = _PREPROCESSING_CONVERTERS
     normalised: Dict[str, Dict[str, Any]] = {}
     for key, value in config.items():
         if not isinstance(value, Mapping):
             continue
         options: Dict[str, Any] = {}
         for opt_key, opt_value in value.items():
-            key_lower = str(opt_key).lower()
-            if key_lower in {
-                "grayscale",
-                "apply_to_easyocr",
-                "use_adaptive_threshold",
-                "use_otsu_threshold",
-            }:
-                options[key_lower] = bool(opt_value)
-            elif key_lower in {
-                "bilateral_diameter",
-                "bilateral_sigma_color",
-                "bilateral_sigma_space",
-                "adaptive_threshold_block_size",
-                "clahe_tile_grid_size",
-            }:
-                try:
-                    options[key_lower] = int(opt_value)
-                except (TypeError, ValueError):
-                    continue
-            elif key_lower in {
-                "clahe_clip_limit",
-                "adaptive_threshold_c",
-                "resize_scale",
-                "sharpen_amount",
-            }:
-                try:
-                    options[key_lower] = float(opt_value)
-                except (TypeError, ValueError):
-                    continue
+            key_lower = _lower_str(opt_key)
+            convert = converters.get(key_lower)
+            if convert is None:
+                continue
+            try:
+                options[key_lower] = convert(opt_value)
+            except (TypeError, ValueError):
+                continue
         if options:
-            normalised[str(key).lower()] = options
+            normalised[_lower_str(key)] = options
     return normalised
 
 
+def _init_field_names() -> frozenset[str]:
+    return frozenset(item.name for item in fields(AppConfig) if item.init)
+
+
+_logger = logging.getLogger("readingrabbit")
+# Bump whenever normalisation changes so sidecars from older builds are ignored.
+_CACHE_FORMAT_VERSION = 3
+_MEMORY_CACHE_SIZE = 16
+_memory_cache: "OrderedDict[str, tuple[tuple[Any, ...], bytes]]" = OrderedDict()
+
+
+def _cache_path(config_path: Path) -> Path:
+    return config_path.with_name(config_path.name + ".cache")
+
+
+def _cache_key(config_path: Path) -> tuple[Any, ...]:
+    stat = config_path.stat()
+    schema = tuple(item.name for item in fields(AppConfig))
+    # ``threads`` is clamped to the CPU count, so a sidecar from another machine differs.
+    return (_CACHE_FORMAT_VERSION, stat.st_mtime_ns, stat.st_size, _available_cpus(), schema)
+
+
+def _config_from_payload(payload: bytes, key: tuple[Any, ...]) -> AppConfig | None:
+    try:
+        cached_key, config = pickle.loads(payload)
+    except (pickle.UnpicklingError, EOFError, AttributeError, ImportError, TypeError, ValueError):
+        _logger.debug("Ignoring unreadable config cache", exc_info=True)
+        return None
+    if cached_key != key or not isinstance(config, AppConfig):
+        return None
+    return config
+
+
+def _read_cache_file(cache_path: Path) -> bytes | None:
+    try:
+        return cache_path.read_bytes()
+    except OSError:
+        return None
+
+
+def _write_cache_file(cache_path: Path, payload: bytes) -> None:
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # The cache is an optimisation only; a read-only folder is fine.
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+def _remember_payload(memory_key: str, key: tuple[Any, ...], payload: bytes) -> None:
+    _memory_cache[memory_key] = (key, payload)
+    _memory_cache.move_to_end(memory_key)
+    while len(_memory_cache) > _MEMORY_CACHE_SIZE:
+        _memory_cache.popitem(last=False)
+
+
 def load_config(path: str | Path = "config.yaml") -> AppConfig:
-    """Load configuration from ``path`` and return an :class:`AppConfig`."""
+    """Load configuration from ``path`` and return an :class:`AppConfig`.
+
+    ``.toml`` files are parsed with :mod:`tomllib`; anything else is read as
+    YAML. The normalised result is cached in memory and next to the file
+    (``<name>.cache``) and reused while the file's modification time and size
+    are unchanged. Every call returns a fresh :class:`AppConfig` instance.
+    """
 
     config_path = Path(path)
-    with config_path.open("r", encoding="utf-8") as fh:
-        data = yaml.safe_load(fh) or {}
+    key = _cache_key(config_path)
+    memory_key = str(config_path.resolve())
+    entry = _memory_cache.get(memory_key)
+    if entry is not None and entry[0] == key:
+        config = _config_from_payload(entry[1], key)
+        if config is not None:
+            _memory_cache.move_to_end(memory_key)
+            return config
+
+    cache_path = _cache_path(config_path)
+    payload = _read_cache_file(cache_path)
+    config = _config_from_payload(payload, key) if payload else None
+    if config is None:
+        config = _parse_config(config_path)
+        payload = pickle.dumps((key, config), protocol=pickle.HIGHEST_PROTOCOL)
+        _write_cache_file(cache_path, payload)
+    _remember_payload(memory_key, key, payload)
+    return config
+
+
+def _read_config_data(config_path: Path) -> Any:
+    if config_path.suffix.lower() == ".toml":
+        if tomllib is None:
+            raise ValueError("TOML configuration files require Python 3.11 or later.")
+        return tomllib.loads(config_path.read_bytes().decode("utf-8"))
+    # Hand libyaml the raw bytes; it detects and decodes UTF-8 itself.
+    return yaml.load(config_path.read_bytes(), Loader=_YamlLoader) or {}
+
+
+def _parse_config(config_path: Path) -> AppConfig:
+    data = _read_config_data(config_path)
 
     if not isinstance(data, dict):
         raise ValueError("Configuration file is invalid: expected a mapping at top level.")
 
     data.setdefault("themes", {})
     data["ocr_languages"] = _ensure_languages(data.get("ocr_languages"))
+    data["ocr_batch_size"] = int(_ensure_float(data.get("ocr_batch_size"), 8.0, 1))
+    data["ocr_workers"] = int(_ensure_float(data.get("ocr_workers"), 1.0, 1))
+    data["ocr_max_side"] = int(_ensure_float(data.get("ocr_max_side"), 960.0, 0))
+    data["sample_fps"] = _ensure_float(data.get("sample_fps"), 2.0, 0.0)
+    data["decode_workers"] = int(_ensure_float(data.get("decode_workers"), 1.0, 1))
+    data["scene_change_threshold"] = int(
+        _ensure_float(data.get("scene_change_threshold"), 3.0, 0)
+    )
+    data["min_text_chars_for_llm"] = int(
+        _ensure_float(data.get("min_text_chars_for_llm"), 4.0, 0)
+    )
+    data["min_ocr_confidence_for_llm"] = min(
+        _ensure_float(data.get("min_ocr_confidence_for_llm"), 0.4, 0.0), 1.0
+    )
     data["monitor_interval"] = _ensure_float(data.get("monitor_interval"), 1.0, 0.1)
     data["resource_history_seconds"] = int(
         _ensure_float(data.get("resource_history_seconds"), 120.0, 10)
@@ -159,7 +328,8 @@ def load_config(path: str | Path = "config.yaml") -> AppConfig:
     data["alert_cooldown_seconds"] = _ensure_float(
         data.get("alert_cooldown_seconds"), 60.0, 1.0
     )
-    data["resource_alerts"] = _normalise_alerts(data.get("resource_alerts"))
+    raw_alerts = data.get("resource_alerts")
+    data["resource_alerts"] = _normalise_alerts(raw_alerts) if raw_alerts else {}
     data["resource_log_path"] = _ensure_path_str(data.get("resource_log_path"))
     data["resource_summary_path"] = _ensure_path_str(data.get("resource_summary_path"))
     data["resource_alert_history_path"] = _ensure_path_str(
@@ -172,9 +342,15 @@ def load_config(path: str | Path = "config.yaml") -> AppConfig:
         60.0,
         10.0,
     )
-    data["ui_layout"] = str(data.get("ui_layout", "stacked")).lower()
+    data["ui_layout"] = _lower_str(data.get("ui_layout"), "stacked")
     data["ui_scaling"] = _ensure_float(data.get("ui_scaling"), 1.0, 0.5)
-    data["ocr_preprocessing"] = _normalise_preprocessing(data.get("ocr_preprocessing"))
+    data["ui_preview_max_width"] = int(
+        _ensure_float(data.get("ui_preview_max_width"), 640.0, 160)
+    )
+    raw_preprocessing = data.get("ocr_preprocessing")
+    data["ocr_preprocessing"] = (
+        _normalise_preprocessing(raw_preprocessing) if raw_preprocessing else {}
+    )
 
     threads = data.get("threads")
     try:
@@ -182,5 +358,7 @@ def load_config(path: str | Path = "config.yaml") -> AppConfig:
         data["threads"] = max(1, threads_int)
     except (TypeError, ValueError):
         data["threads"] = 1
+    data["threads"] = min(data["threads"], max(1, _available_cpus() - 1))
 
-    return AppConfig(**data)
+    known_fields = _init_field_names()
+    return AppConfig(**{key: value for key, value in data.items() if key in known_fields})
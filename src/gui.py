@@ -2,23 +2,35 @@
 """Tkinter-based GUI for ReadingRabbit OCR."""
 from __future__ import annotations
 
+import itertools
 import os
 import sys
 import threading
 import time
 import tkinter as tk
-import webbrowser
-from collections import deque
-from copy import deepcopy
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from tkinter import messagebox, ttk
-from typing import Any, Callable, Mapping, Optional
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Mapping, Optional
 
 import cv2
-from PIL import Image, ImageTk
+import numpy as np
 
+if TYPE_CHECKING:  # PIL is imported on the first preview frame
+    from PIL import ImageTk
 
-DEFAULT_THEME: dict[str, Any] = {
+
+@lru_cache(maxsize=None)
+def _pil_modules():
+    # Only the preview uses PIL, so its import cost moves from start-up to the first frame.
+    from PIL import Image, ImageTk
+
+    return Image, ImageTk
+
+
+DEFAULT_THEME: Mapping[str, Any] = MappingProxyType({
     "background": "#0b0c10",
     "surface": "#1f2833",
     "accent": "#45a29e",
@@ -27,39 +39,118 @@ DEFAULT_THEME: dict[str, Any] = {
     "danger": "#ff6b6b",
     "font": "Segoe UI",
     "font_size": 11,
-    "chart_colors": {
+    "chart_colors": MappingProxyType({
         "cpu": "#66fcf1",
         "ram": "#45a29e",
         "gpu": "#ff9f1c",
         "vram": "#f15bb5",
-    },
-}
+    }),
+})
+
+
+_RESOURCE_FORMAT = "CPU: %.1f%% | GPU: %s | VRAM: %s | RAM: %.1f%%"
+_PERCENT_FORMAT = "%.1f%%"
+_NOT_AVAILABLE = "N/A"
+
+_NESTED = object()  # marks a nested mapping inside a theme cache key
 
 
 def build_theme(custom_theme: Mapping[str, Any] | None) -> dict[str, Any]:
     """Merge user-specified theme settings with defaults."""
 
-    theme = deepcopy(DEFAULT_THEME)
-    if not custom_theme:
-        return theme
+    key = _theme_key(custom_theme)
+    if key is None:
+        return _merge_theme(custom_theme)
+    cached = _build_theme_cached(key)
+    theme = cached.copy()
+    theme["chart_colors"] = cached["chart_colors"].copy()
+    return theme
+
 
-    chart_colors = theme.get("chart_colors", {}).copy()
+def _theme_key(custom_theme: Mapping[str, Any] | None) -> tuple[Any, ...] | None:
+    if not custom_theme:
+        return ()
+    items = []
     for key, value in custom_theme.items():
-        if key == "chart_colors" and isinstance(value, Mapping):
-            chart_colors.update(value)  # type: ignore[arg-type]
-        else:
-            theme[key] = value
+        if isinstance(value, Mapping):
+            value = (_NESTED, tuple(sorted(value.items(), key=lambda item: str(item[0]))))
+        items.append((key, value))
+    items.sort(key=lambda item: str(item[0]))
+    key_tuple = tuple(items)
+    try:
+        hash(key_tuple)
+    except TypeError:  # unhashable values (e.g. lists) bypass the cache
+        return None
+    return key_tuple
+
+
+@lru_cache(maxsize=16)
+def _build_theme_cached(items: tuple[Any, ...]) -> dict[str, Any]:
+    custom_theme = {
+        key: dict(value[1]) if type(value) is tuple and value[:1] == (_NESTED,) else value
+        for key, value in items
+    }
+    return _merge_theme(custom_theme)
+
+
+def _merge_theme(custom_theme: Mapping[str, Any] | None) -> dict[str, Any]:
+    chart_colors = {**DEFAULT_THEME["chart_colors"]}
+    if not custom_theme:
+        return {**DEFAULT_THEME, "chart_colors": chart_colors}
+
+    custom_colors = custom_theme.get("chart_colors")
+    if isinstance(custom_colors, Mapping):
+        chart_colors.update(custom_colors)
+    theme = {**DEFAULT_THEME, **custom_theme}
     theme["chart_colors"] = chart_colors
     return theme
 
 
-def _clamp(value: float) -> float:
-    return max(0.0, min(100.0, float(value)))
+_MISSING = float("nan")
+
+
+def _polyline_segments(xs: np.ndarray, ys: np.ndarray) -> list[list[float]]:
+    """Split a series at missing (NaN) samples into flat canvas coordinate lists."""
+
+    missing = np.isnan(ys)
+    if missing.all():
+        return []
+    points = np.column_stack((xs, ys))
+    if not missing.any():
+        return [points.ravel().tolist()] if len(points) >= 2 else []
+    segments: list[list[float]] = []
+    for run in np.split(points, np.flatnonzero(missing)):
+        run = run[~np.isnan(run[:, 1])]
+        if len(run) >= 2:
+            segments.append(run.ravel().tolist())
+    return segments
+
+
+def _envelope(values: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """Return interleaved per-bucket minima and maxima, ignoring NaN samples."""
+
+    with np.errstate(invalid="ignore"):
+        low = np.fmin.reduceat(values, starts)
+        high = np.fmax.reduceat(values, starts)
+    return np.column_stack((low, high)).ravel()
+
+
+@dataclass(frozen=True, slots=True)
+class _SeriesSpec:
+    """Fixed label and colour for one plotted metric."""
+
+    key: str
+    label: str
+    color: str
 
 
 class ResourceHistoryCanvas(tk.Canvas):
     """Simple line chart to display historical resource usage."""
 
+    SERIES_KEYS = ("cpu", "ram", "gpu", "vram")
+    MARGIN = 16
+    STEADY_EPSILON = 0.5  # percent; below one pixel at typical chart heights
+
     def __init__(
         self,
         master: tk.Misc,
@@ -76,38 +167,42 @@ class ResourceHistoryCanvas(tk.Canvas):
         self.max_points = max(2, int(round(self.history_seconds / self.monitor_interval)))
         self.font_family: str = theme.get("font", "Segoe UI")
         self.font_size: int = int(theme.get("font_size", 11))
+        # Resolved once; _build_static reuses these on every rebuild.
+        self._text_color: str = theme.get("text", DEFAULT_THEME["text"])
+        self._bg_color: str = theme.get("surface", DEFAULT_THEME["surface"])
+        self._grid_color: str = theme.get("background", DEFAULT_THEME["background"])
+        self._small_font = (self.font_family, max(8, self.font_size - 2))
+        self._plot_font = (self.font_family, self.font_size - 1)
 
         super().__init__(
             master,
             width=width,
             height=height,
-            bg=theme.get("surface", DEFAULT_THEME["surface"]),
+            bg=self._bg_color,
             highlightthickness=0,
         )
 
         chart_colors = theme.get("chart_colors", {})
-        self.series = {
-            "cpu": {
-                "label": "CPU",
-                "color": chart_colors.get("cpu", DEFAULT_THEME["chart_colors"]["cpu"]),
-                "data": deque(maxlen=self.max_points),
-            },
-            "ram": {
-                "label": "RAM",
-                "color": chart_colors.get("ram", DEFAULT_THEME["chart_colors"]["ram"]),
-                "data": deque(maxlen=self.max_points),
-            },
-            "gpu": {
-                "label": "GPU",
-                "color": chart_colors.get("gpu", DEFAULT_THEME["chart_colors"]["gpu"]),
-                "data": deque(maxlen=self.max_points),
-            },
-            "vram": {
-                "label": "VRAM",
-                "color": chart_colors.get("vram", DEFAULT_THEME["chart_colors"]["vram"]),
-                "data": deque(maxlen=self.max_points),
-            },
-        }
+        default_colors = DEFAULT_THEME["chart_colors"]
+        self.series = tuple(
+            _SeriesSpec(key, key.upper(), chart_colors.get(key, default_colors[key]))
+            for key in self.SERIES_KEYS
+        )
+        # Ring buffer with one row per series (ordered as SERIES_KEYS); NaN = no data.
+        self._samples = np.full(
+            (len(self.SERIES_KEYS), self.max_points), np.nan, dtype=np.float32
+        )
+        self._head = 0
+        self._count = 0
+        # First sample of the current run of near-identical samples, and its length.
+        self._steady_anchor = np.full(len(self.SERIES_KEYS), np.nan)
+        self._steady_count = 0
+        self._line_ids: dict[str, list[int]] = {}
+        self._redraw_pending = False
+        self._static_built = False
+        self._width = width
+        self._height = height
+        self.bind("<Configure>", self._on_resize)
 
     def add_sample(
         self,
@@ -116,33 +211,116 @@ class ResourceHistoryCanvas(tk.Canvas):
         gpu_mem: Optional[float],
         ram: float,
     ) -> None:
-        self.series["cpu"]["data"].append(_clamp(cpu))
-        self.series["ram"]["data"].append(_clamp(ram))
-        self.series["gpu"]["data"].append(None if gpu is None else _clamp(gpu))
-        self.series["vram"]["data"].append(None if gpu_mem is None else _clamp(gpu_mem))
-        self._redraw()
+        column = self._samples[:, self._head]
+        column[:] = (
+            cpu,
+            ram,
+            _MISSING if gpu is None else gpu,
+            _MISSING if gpu_mem is None else gpu_mem,
+        )
+        np.clip(column, 0.0, 100.0, out=column)
+        self._head = (self._head + 1) % self.max_points
+        self._count = min(self._count + 1, self.max_points)
+
+        anchor = self._steady_anchor
+        with np.errstate(invalid="ignore"):
+            same = np.abs(column - anchor) <= self.STEADY_EPSILON
+        same |= np.isnan(column) & np.isnan(anchor)
+        if same.all():
+            self._steady_count += 1
+        else:
+            anchor[:] = column
+            self._steady_count = 0
+        if self._steady_count >= self.max_points:
+            # The whole window was already drawn flat; scrolling it changes nothing.
+            return
+        self._request_redraw()
 
     def clear(self) -> None:
-        for series in self.series.values():
-            series["data"].clear()
+        self._samples.fill(np.nan)
+        self._head = 0
+        self._count = 0
+        self._steady_anchor.fill(np.nan)
+        self._steady_count = 0
+        self._request_redraw()
+
+    def history(self) -> np.ndarray:
+        """Return a read-only ``(series, count)`` view of the history, oldest first."""
+
+        view = self._ordered_samples().view()
+        view.flags.writeable = False
+        return view
+
+    def _ordered_samples(self) -> np.ndarray:
+        """Return the buffered samples oldest-first as a ``(series, count)`` array."""
+
+        if self._count < self.max_points:
+            return self._samples[:, : self._count]
+        head = self._head
+        if head == 0:
+            return self._samples
+        return np.concatenate((self._samples[:, head:], self._samples[:, :head]), axis=1)
+
+    def _on_resize(self, event: tk.Event) -> None:
+        if (event.width, event.height) == (self._width, self._height):
+            return
+        self._width = event.width
+        self._height = event.height
+        # Static geometry depends on the size, so rebuild every item.
+        self.delete("all")
+        self._line_ids.clear()
+        self._static_built = False
+        self._request_redraw()
+
+    def _request_redraw(self) -> None:
+        if self._redraw_pending:
+            return
+        self._redraw_pending = True
+        self.after(16, self._do_redraw)
+
+    def _do_redraw(self) -> None:
+        self._redraw_pending = False
         self._redraw()
 
-    def _redraw(self) -> None:
-        width = int(float(self["width"]))
-        height = int(float(self["height"]))
-        margin = 16
-        plot_height = height - (margin * 2)
-        plot_width = width - (margin * 2)
-        text_color = self.theme.get("text", DEFAULT_THEME["text"])
-        background = self.theme.get("surface", DEFAULT_THEME["surface"])
-        grid_color = self.theme.get("background", DEFAULT_THEME["background"])
+    def _set_series_segments(
+        self,
+        key: str,
+        segments: list[list[float]],
+        color: str,
+    ) -> None:
+        pool = self._line_ids.setdefault(key, [])
+        for idx, coords in enumerate(segments):
+            if idx < len(pool):
+                self.coords(pool[idx], *coords)
+                self.itemconfigure(pool[idx], state="normal")
+            else:
+                pool.append(
+                    self.create_line(
+                        *coords,
+                        fill=color,
+                        width=2,
+                        smooth=True,
+                        tags=("series",),
+                    )
+                )
+                # Keep the legend and axis labels above newly created lines.
+                self.tag_raise("overlay")
+        for line_id in pool[len(segments):]:
+            self.itemconfigure(line_id, state="hidden")
 
-        self.delete("all")
-        self.create_rectangle(0, 0, width, height, fill=background, outline="")
+    def _build_static(self) -> None:
+        """Create the background, grid and label items that never change shape."""
 
-        small_font = (self.font_family, max(8, self.font_size - 2))
+        width = self._width
+        height = self._height
+        margin = self.MARGIN
+        plot_height = height - (margin * 2)
+        text_color = self._text_color
+        grid_color = self._grid_color
+        small_font = self._small_font
+        overlay = ("overlay",)
 
-        # Draw grid lines and labels
+        self.create_rectangle(0, 0, width, height, fill=self._bg_color, outline="")
         for percent in range(0, 101, 25):
             y = height - margin - ((percent / 100) * plot_height)
             self.create_line(margin, y, width - margin, y, fill=grid_color, dash=(2, 4))
@@ -155,95 +333,124 @@ class ResourceHistoryCanvas(tk.Canvas):
                 font=small_font,
             )
 
-        sample_count = len(self.series["cpu"]["data"])
-        if sample_count == 0:
-            self.create_text(
-                width / 2,
-                height / 2,
-                text="Waiting for samples…",
-                fill=text_color,
-                font=(self.font_family, self.font_size - 1),
-            )
-            return
-
-        x_step = plot_width / max(sample_count - 1, 1)
-
-        for key in ("cpu", "ram", "gpu", "vram"):
-            series = self.series[key]
-            values = list(series["data"])
-            if not any(val is not None for val in values):
-                continue
-            coords: list[float] = []
-            for idx, value in enumerate(values):
-                if value is None:
-                    if len(coords) >= 4:
-                        self.create_line(
-                            *coords,
-                            fill=series["color"],
-                            width=2,
-                            smooth=True,
-                        )
-                    coords = []
-                    continue
-                x = margin + (idx * x_step)
-                y = height - margin - ((value / 100) * plot_height)
-                coords.extend([x, y])
-            if len(coords) >= 4:
-                self.create_line(
-                    *coords,
-                    fill=series["color"],
-                    width=2,
-                    smooth=True,
-                )
-
-        # Legend
-        legend_x = margin
-        legend_y = margin - 6
-        for key in ("cpu", "ram", "gpu", "vram"):
-            series = self.series[key]
-            if not any(val is not None for val in series["data"]):
-                continue
-            self.create_rectangle(
-                legend_x,
-                legend_y,
-                legend_x + 12,
-                legend_y + 12,
-                fill=series["color"],
-                outline=series["color"],
+        self._waiting_id = self.create_text(
+            width / 2,
+            height / 2,
+            text="Waiting for samples…",
+            fill=text_color,
+            font=self._plot_font,
+            tags=overlay,
+        )
+        self._legend_ids: dict[str, tuple[int, int]] = {}
+        for series in self.series:
+            swatch = self.create_rectangle(
+                0,
+                0,
+                12,
+                12,
+                fill=series.color,
+                outline=series.color,
+                state="hidden",
+                tags=overlay,
             )
-            self.create_text(
-                legend_x + 16,
-                legend_y + 6,
-                text=series["label"],
+            label = self.create_text(
+                0,
+                0,
+                text=series.label,
                 anchor="w",
                 fill=text_color,
                 font=small_font,
+                state="hidden",
+                tags=overlay,
             )
-            legend_x += 80
-
-        span_seconds = min(
-            self.history_seconds,
-            (sample_count - 1) * self.monitor_interval,
-        )
-        self.create_text(
+            self._legend_ids[series.key] = (swatch, label)
+        self._span_id = self.create_text(
             margin,
             height - margin + 12,
-            text=f"-{int(span_seconds)}s",
+            text="",
             anchor="w",
             fill=text_color,
             font=small_font,
+            state="hidden",
+            tags=overlay,
         )
-        self.create_text(
+        self._now_id = self.create_text(
             width - margin,
             height - margin + 12,
             text="Now",
             anchor="e",
             fill=text_color,
             font=small_font,
+            state="hidden",
+            tags=overlay,
+        )
+        self._static_built = True
+
+    def _redraw(self) -> None:
+        if not self._static_built:
+            self._build_static()
+
+        width = self._width
+        height = self._height
+        margin = self.MARGIN
+        plot_height = height - (margin * 2)
+        plot_width = width - (margin * 2)
+
+        samples = self._ordered_samples()
+        sample_count = samples.shape[1]
+        if sample_count == 0:
+            for series in self.series:
+                self._set_series_segments(series.key, [], series.color)
+                for item in self._legend_ids[series.key]:
+                    self.itemconfigure(item, state="hidden")
+            self.itemconfigure(self._span_id, state="hidden")
+            self.itemconfigure(self._now_id, state="hidden")
+            self.itemconfigure(self._waiting_id, state="normal")
+            return
+
+        self.itemconfigure(self._waiting_id, state="hidden")
+        x_step = plot_width / max(sample_count - 1, 1)
+        y_scale = plot_height / 100
+        columns = max(1, int(plot_width))
+        if sample_count > columns:
+            # More samples than pixels: draw a min/max envelope per pixel column.
+            starts = np.linspace(0, sample_count, columns, endpoint=False).astype(np.intp)
+            xs = margin + (np.repeat(starts, 2) * x_step)
+        else:
+            starts = None
+            xs = margin + (np.arange(sample_count) * x_step)
+
+        legend_x = margin
+        legend_y = margin - 6
+        for row, series in enumerate(self.series):
+            values = samples[row]
+            if starts is not None:
+                values = _envelope(values, starts)
+            ys = (height - margin) - (values * y_scale)
+            self._set_series_segments(series.key, _polyline_segments(xs, ys), series.color)
+
+            swatch, label = self._legend_ids[series.key]
+            if np.isnan(values).all():
+                self.itemconfigure(swatch, state="hidden")
+                self.itemconfigure(label, state="hidden")
+                continue
+            self.coords(swatch, legend_x, legend_y, legend_x + 12, legend_y + 12)
+            self.coords(label, legend_x + 16, legend_y + 6)
+            self.itemconfigure(swatch, state="normal")
+            self.itemconfigure(label, state="normal")
+            legend_x += 80
+
+        span_seconds = min(
+            self.history_seconds,
+            (sample_count - 1) * self.monitor_interval,
         )
+        self.itemconfigure(self._span_id, text=f"-{int(span_seconds)}s", state="normal")
+        self.itemconfigure(self._now_id, state="normal")
 
 
 class AppGUI:
+    POLL_INTERVAL_MS = 16
+
     def __init__(
         self,
         master: tk.Tk,
@@ -260,11 +467,15 @@ class AppGUI:
         resource_alert_history_path: Optional[str] = None,
         layout: str = "stacked",
         scaling: float = 1.0,
+        preview_max_width: int = 640,
     ) -> None:
         self.master = master
+        self.preview_max_width = max(1, int(preview_max_width))
         self._on_start = on_start
         self.on_toggle_monitor = on_toggle_monitor
-        self.monitoring = True
+        # Set while sampling should run; ResourceMonitor reads it from its own thread.
+        self.monitoring = threading.Event()
+        self.monitoring.set()
         self.monitor_button: Optional[ttk.Button] = None
         self.show_resource_usage = show_resource_usage
         self._processing = False
@@ -284,6 +495,15 @@ class AppGUI:
         self.summary_label: Optional[ttk.Label] = None
         self._layout = layout.lower()
         self._summary_placeholder = "Summary will appear after processing."
+        self._last_progress_key = -1
+        self._pending: dict[Hashable, tuple[Callable[..., Any], tuple, dict]] = {}
+        self._pending_lock = threading.Lock()
+        self._flush_scheduled = False
+        self._polling = False
+        self._call_ids = itertools.count()
+        self._ui_thread = threading.get_ident()
+        self._rgb_buffer: Optional[np.ndarray] = None
+        self._preview_image: Optional[ImageTk.PhotoImage] = None
 
         self.theme = build_theme(theme)
         master.title("ReadingRabbit")
@@ -384,7 +604,10 @@ class AppGUI:
         )
         self.progress.grid(row=1, column=0, sticky="ew", pady=6)
 
-        self.status_label = ttk.Label(parent, text="Idle", style="Status.TLabel")
+        self._status_var = tk.StringVar(self.master, value="Idle")
+        self.status_label = ttk.Label(
+            parent, textvariable=self._status_var, style="Status.TLabel"
+        )
         self.status_label.grid(row=2, column=0, sticky="w", pady=6)
 
         self.start_button = ttk.Button(parent, text="Start", command=self._on_start_clicked)
@@ -403,9 +626,10 @@ class AppGUI:
         resources_text = self._resource_placeholder
         if not show_resource_usage:
             resources_text = "Resource monitoring disabled in config."
+        self._resources_var = tk.StringVar(self.master, value=resources_text)
         self.resources_label = ttk.Label(
             parent,
-            text=resources_text,
+            textvariable=self._resources_var,
             style="Resources.TLabel",
             wraplength=360,
             justify="left",
@@ -425,17 +649,22 @@ class AppGUI:
             self.history_canvas.grid(row=row, column=0, sticky="ew", pady=(6, 12))
             row += 1
 
-        self.eta_label = ttk.Label(parent, text="ETA: 00:00:00", style="Resources.TLabel")
+        self._eta_var = tk.StringVar(self.master, value="ETA: 00:00:00")
+        self.eta_label = ttk.Label(
+            parent, textvariable=self._eta_var, style="Resources.TLabel"
+        )
         self.eta_label.grid(row=row, column=0, sticky="w", pady=(6, 12))
         row += 1
 
-        self.alert_label = ttk.Label(parent, text="", style="Alert.TLabel")
+        self._alert_var = tk.StringVar(self.master, value="")
+        self.alert_label = ttk.Label(parent, textvariable=self._alert_var, style="Alert.TLabel")
         self.alert_label.grid(row=row, column=0, sticky="w", pady=(0, 12))
         row += 1
 
+        self._summary_var = tk.StringVar(self.master, value=self._summary_placeholder)
         self.summary_label = ttk.Label(
             parent,
-            text=self._summary_placeholder,
+            textvariable=self._summary_var,
             style="Resources.TLabel",
             wraplength=360,
             justify="left",
@@ -443,7 +672,7 @@ class AppGUI:
         self.summary_label.grid(row=row, column=0, sticky="w", pady=(0, 12))
         row += 1
 
-        if self.on_toggle_monitor is not None and show_resource_usage:
+        if show_resource_usage:
             self.monitor_button = ttk.Button(
                 parent,
                 text="Pause Monitor",
@@ -511,18 +740,66 @@ class AppGUI:
         button.grid(row=row, column=0, sticky="ew", pady=(0, 12))
         return button
 
+    def _schedule(
+        self,
+        key: Hashable,
+        func: Callable[..., Any],
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """Queue ``func`` for the next idle flush, replacing any call under ``key``."""
+
+        with self._pending_lock:
+            self._pending.pop(key, None)
+            self._pending[key] = (func, args, kwargs)
+            # Worker threads never touch Tk; the poll loop armed for the run picks their calls up.
+            if self._flush_scheduled or threading.get_ident() != self._ui_thread:
+                return
+            self._flush_scheduled = True
+        self.master.after_idle(self._flush_pending)
+
+    def _schedule_call(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        self._schedule(("call", next(self._call_ids)), func, *args, **kwargs)
+
+    def _flush_pending(self) -> None:
+        with self._pending_lock:
+            pending = list(self._pending.values())
+            self._pending.clear()
+            self._flush_scheduled = False
+        for func, args, kwargs in pending:
+            try:
+                func(*args, **kwargs)
+            except Exception:
+                self.master.report_callback_exception(*sys.exc_info())
+
+    def _start_polling(self) -> None:
+        if self._polling:
+            return
+        self._polling = True
+        self.master.after(self.POLL_INTERVAL_MS, self._poll_pending)
+
+    def _poll_pending(self) -> None:
+        if self._pending:
+            self._flush_pending()
+        # Workers only queue calls while a run is active, so the loop stops with it.
+        if self._processing or self._pending:
+            self.master.after(self.POLL_INTERVAL_MS, self._poll_pending)
+        else:
+            self._polling = False
+
     def _on_start_clicked(self) -> None:
         if self._processing:
             return
         self._processing = True
         self.set_processing_state(True)
+        self._start_polling()
         threading.Thread(target=self._run_start_callback, daemon=True).start()
 
     def _run_start_callback(self) -> None:
         try:
             self._on_start()
         finally:
-            self.master.after(0, self._on_processing_finished)
+            self._schedule_call(self._on_processing_finished)
 
     def _on_processing_finished(self) -> None:
         self._processing = False
@@ -537,9 +814,10 @@ class AppGUI:
                 self.start_button.state(["!disabled"])
                 self.start_button.config(text="Start")
 
-        self.master.after(0, update)
+        self._schedule("processing_state", update)
 
     def prepare_for_run(self) -> None:
+        self._last_progress_key = -1
         self.clear_alert()
         self.reset_resources()
         self.update_status("Initializing…")
@@ -547,45 +825,44 @@ class AppGUI:
         self.update_eta(0.0)
         self.clear_summary()
         if self.history_canvas is not None:
-            self.master.after(0, self.history_canvas.clear)
+            self._schedule_call(self.history_canvas.clear)
+        self.monitoring.set()
         if self.monitor_button is not None:
             def _reset_button() -> None:
-                self.monitoring = True
                 self.monitor_button.config(text="Pause Monitor")
 
-            self.master.after(0, _reset_button)
+            self._schedule("monitor_button", _reset_button)
 
     def reset_resources(self) -> None:
-        def update() -> None:
-            self.resources_label.configure(text=self._resource_placeholder)
-
-        self.master.after(0, update)
+        self._schedule(
+            "resources", self._resources_var.set, self._resource_placeholder
+        )
 
     def clear_alert(self) -> None:
-        def update() -> None:
-            self.alert_label.configure(text="")
-
-        self.master.after(0, update)
+        self._schedule("alert", self._alert_var.set, "")
 
     def clear_summary(self) -> None:
         def update() -> None:
-            if self.summary_label is not None:
-                self.summary_label.configure(text=self._summary_placeholder)
+            self._summary_var.set(self._summary_placeholder)
             if self.summary_button is not None:
                 self.summary_button.state(["disabled"])
             if self.alert_button is not None:
                 self.alert_button.state(["disabled"])
 
-        self.master.after(0, update)
+        self._schedule("summary", update)
 
     def update_progress(self, value: float) -> None:
-        def update() -> None:
-            self.progress["value"] = max(0.0, min(100.0, value))
-
-        self.master.after(0, update)
+        self._schedule("progress", self.progress.configure, value=max(0.0, min(100.0, value)))
 
     def update_status(self, text: str) -> None:
-        self.master.after(0, lambda: self.status_label.configure(text=text))
+        self._schedule("status", self._status_var.set, text)
+
+    def update_status_progress(self, progress: float) -> None:
+        progress_key = int(progress * 100)
+        if progress_key == self._last_progress_key:
+            return
+        self._last_progress_key = progress_key
+        self.update_status("Processing… %.2f%%" % progress)
 
     def update_resources(
         self,
@@ -594,54 +871,61 @@ class AppGUI:
         gpu_mem: Optional[float],
         ram: float,
     ) -> None:
-        def update() -> None:
-            gpu_text = "N/A" if gpu is None else f"{gpu:.1f}%"
-            vram_text = "N/A" if gpu_mem is None else f"{gpu_mem:.1f}%"
-            self.resources_label.configure(
-                text=(
-                    f"CPU: {cpu:.1f}% | GPU: {gpu_text} | VRAM: {vram_text} | RAM: {ram:.1f}%"
-                )
-            )
-            if self.history_canvas is not None:
-                self.history_canvas.add_sample(cpu, gpu, gpu_mem, ram)
-            if self._resource_log_path is not None and self.log_button is not None:
-                if self._resource_log_path.exists():
-                    self.log_button.state(["!disabled"])
-                else:
-                    self.log_button.state(["disabled"])
+        text = _RESOURCE_FORMAT % (
+            cpu,
+            _NOT_AVAILABLE if gpu is None else _PERCENT_FORMAT % gpu,
+            _NOT_AVAILABLE if gpu_mem is None else _PERCENT_FORMAT % gpu_mem,
+            ram,
+        )
+        self._schedule("resources", self._resources_var.set, text)
+        if self.history_canvas is not None:
+            self._schedule_call(self.history_canvas.add_sample, cpu, gpu, gpu_mem, ram)
 
-        self.master.after(0, update)
+    def notify_resource_log_ready(self, path: Path) -> None:
+        """Enable the resource log button once the monitor has created the file."""
 
-    def update_eta(self, seconds: float) -> None:
-        def update() -> None:
-            total_seconds = max(0, int(seconds))
-            eta_str = time.strftime("%H:%M:%S", time.gmtime(total_seconds))
-            self.eta_label.configure(text=f"ETA: {eta_str}")
+        self._resource_log_path = path
+        if self.log_button is not None:
+            self._schedule("log_button", self.log_button.state, ["!disabled"])
 
-        self.master.after(0, update)
+    def update_eta(self, seconds: float) -> None:
+        total_seconds = max(0, int(seconds))
+        eta_str = time.strftime("%H:%M:%S", time.gmtime(total_seconds))
+        self._schedule("eta", self._eta_var.set, f"ETA: {eta_str}")
 
     def show_frame(self, frame) -> None:
         if frame is None:
             return
 
-        def update() -> None:
-            rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            image = Image.fromarray(rgb)
-            imgtk = ImageTk.PhotoImage(image=image)
-            self.video_label.imgtk = imgtk
-            self.video_label.configure(image=imgtk)
-
-        self.master.after(0, update)
+        self._schedule("frame", self._paint_frame, frame)
+
+    def _paint_frame(self, frame) -> None:
+        Image, ImageTk = _pil_modules()
+        height, width = frame.shape[:2]
+        if width > self.preview_max_width:
+            height = max(1, round(height * self.preview_max_width / width))
+            width = self.preview_max_width
+            frame = cv2.resize(frame, (width, height), interpolation=cv2.INTER_AREA)
+        if self._rgb_buffer is None or self._rgb_buffer.shape[:2] != (height, width):
+            # Allocate once per frame size; later frames are pasted in place.
+            self._rgb_buffer = np.empty((height, width, 3), dtype=np.uint8)
+            self._preview_image = ImageTk.PhotoImage(Image.new("RGB", (width, height)))
+            self.video_label.imgtk = self._preview_image
+            self.video_label.configure(image=self._preview_image)
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buffer)
+        self._preview_image.paste(
+            Image.frombuffer("RGB", (width, height), self._rgb_buffer, "raw", "RGB", 0, 1)
+        )
 
     def show_error(self, text: str) -> None:
-        self.master.after(0, lambda: messagebox.showerror("ReadingRabbit Error", text))
+        self._schedule_call(messagebox.showerror, "ReadingRabbit Error", text)
 
     def show_alert(self, text: str) -> None:
         def update() -> None:
-            self.alert_label.configure(text=f"Alert: {text}")
+            self._alert_var.set(f"Alert: {text}")
             messagebox.showwarning("ReadingRabbit Alert", text)
 
-        self.master.after(0, update)
+        self._schedule_call(update)
 
     def show_summary(
         self,
@@ -650,8 +934,7 @@ class AppGUI:
         alert_log_path: Optional[str],
     ) -> None:
         def update() -> None:
-            if self.summary_label is not None:
-                self.summary_label.configure(text=text)
+            self._summary_var.set(text)
             if summary_path:
                 path = Path(summary_path).expanduser()
                 self._resource_summary_path = path
@@ -664,16 +947,18 @@ class AppGUI:
                     self.alert_button.state(["!disabled"])
             messagebox.showinfo("Resource Summary", text)
 
-        self.master.after(0, update)
+        self._schedule_call(update)
 
     def _toggle_monitor(self) -> None:
-        self.monitoring = not self.monitoring
+        if self.monitoring.is_set():
+            self.monitoring.clear()
+        else:
+            self.monitoring.set()
+        active = self.monitoring.is_set()
         if self.monitor_button:
-            self.monitor_button["text"] = (
-                "Resume Monitor" if not self.monitoring else "Pause Monitor"
-            )
+            self.monitor_button["text"] = "Pause Monitor" if active else "Resume Monitor"
         if self.on_toggle_monitor:
-            self.on_toggle_monitor(self.monitoring)
+            self.on_toggle_monitor(active)
 
     def _open_resource_log(self) -> None:
         if self._resource_log_path is None:
@@ -701,6 +986,8 @@ class AppGUI:
             if sys.platform.startswith("win"):
                 os.startfile(path)  # type: ignore[attr-defined]
             else:
+                import webbrowser
+
                 webbrowser.open(path.resolve().as_uri())
         except Exception as exc:  # pragma: no cover - platform specific
             messagebox.showerror(description, f"Unable to open file: {exc}")
@@ -3,17 +3,256 @@
 from __future__ import annotations
 
 import logging
+from collections import OrderedDict
+from contextlib import nullcontext
+from functools import lru_cache
 from threading import Lock
+from typing import Callable, Sequence, Tuple
 
 try:
     from transformers import pipeline
 except Exception:  # transformers is optional at runtime
     pipeline = None  # type: ignore
 
+try:
+    import torch
+except Exception:  # torch ships with transformers but is optional here too
+    torch = None  # type: ignore
+
 
-_verifier = None
 _lock = Lock()
+_result_lock = Lock()
 _logger = logging.getLogger("readingrabbit")
+_VERIFIER_CACHE_SIZE = 4
+_RESULT_CACHE_SIZE = 1024
+_BATCH_SIZE = 16
+_MAX_NEW_TOKENS = 128
+# Longer OCR snippets are verified in pieces so encoder cost stays bounded.
+_MAX_INPUT_CHARS = 1024
+
+ModelKey = Tuple[str, bool, int, bool]  # model name, use_gpu, gpu_index, quantize
+_result_cache: "OrderedDict[tuple[ModelKey, str, int], str]" = OrderedDict()
+
+
+def _model_dtype(use_gpu: bool):
+    # fp16 overflows in T5-style models, so GPUs without bf16 stay on float32.
+    if torch is None or not use_gpu:
+        return None
+    try:
+        if torch.cuda.is_bf16_supported():
+            return torch.bfloat16
+    except Exception:
+        pass
+    return None
+
+
+def _inference_mode():
+    return torch.inference_mode() if torch is not None else nullcontext()
+
+
+def _quantize_int8(verifier, model_name: str):
+    # Dynamic int8 quantisation is a CPU-only kernel; GPU runs use bf16 where supported.
+    try:
+        verifier.model = torch.ao.quantization.quantize_dynamic(
+            verifier.model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+    except Exception:
+        _logger.warning("int8 quantisation failed for '%s', using full precision", model_name)
+    return verifier
+
+
+@lru_cache(maxsize=_VERIFIER_CACHE_SIZE)
+def _build_verifier(model_name: str, use_gpu: bool, gpu_index: int, quantize: bool = False):
+    # A failed load is cached as None so a broken model is not retried per frame.
+    try:
+        device = gpu_index if use_gpu else -1
+        dtype = _model_dtype(use_gpu)
+        kwargs = {"torch_dtype": dtype} if dtype is not None else {}
+        verifier = pipeline("text2text-generation", model=model_name, device=device, **kwargs)
+    except Exception:
+        _logger.warning("Unable to load LLM model '%s'", model_name)
+        return None
+    if quantize and not use_gpu and torch is not None:
+        verifier = _quantize_int8(verifier, model_name)
+    return verifier
+
+
+def _get_verifier(model_key: ModelKey):
+    # lru_cache alone would let two threads build the same model concurrently.
+    with _lock:
+        return _build_verifier(*model_key)
+
+
+def _cached_generate(verifier, model_key: ModelKey, prompt: str, max_new_tokens: int) -> str:
+    # OCR repeats headers/footers across frames, so identical prompts are common.
+    # The caller's verifier is used directly; only the result lookup is locked.
+    cache_key = (model_key, prompt, max_new_tokens)
+    with _result_lock:
+        cached = _result_cache.get(cache_key)
+        if cached is not None:
+            _result_cache.move_to_end(cache_key)
+            return cached
+    with _inference_mode():
+        result = verifier(prompt, max_new_tokens=max_new_tokens)
+    cleaned = result[0]["generated_text"].strip()
+    with _result_lock:
+        _result_cache[cache_key] = cleaned
+        while len(_result_cache) > _RESULT_CACHE_SIZE:
+            _result_cache.popitem(last=False)
+    return cleaned
+
+
+@lru_cache(maxsize=16)
+def _prompt_parts(prompt_template: str) -> tuple[str, str, bool] | None:
+    # Templates whose only field is a single {text} become a plain concatenation.
+    literal = prompt_template.replace("{text}", "")
+    if "{" in literal or "}" in literal or prompt_template.count("{text}") > 1:
+        return None
+    prefix, placeholder, suffix = prompt_template.partition("{text}")
+    return prefix, suffix, bool(placeholder)
+
+
+def _split_input(text: str) -> list[tuple[str, str]]:
+    """Split ``text`` into ``(chunk, separator)`` pairs that re-join to the original."""
+
+    if not text.strip():
+        return [("", text)]
+    if len(text) <= _MAX_INPUT_CHARS:
+        return [(text, "")]
+    # The leading pair only carries whitespace found before the first chunk.
+    pieces: list[tuple[str, str]] = [("", "")]
+    start = 0
+    while start < len(text):
+        end = start + _MAX_INPUT_CHARS
+        if end < len(text):
+            cut = max(text.rfind(" ", start, end), text.rfind("\n", start, end))
+            if cut > start:
+                end = cut
+        segment = text[start:end]
+        start = end
+        chunk = segment.strip()
+        lead = len(segment) - len(segment.lstrip())
+        previous, separator = pieces[-1]
+        if not chunk:
+            pieces[-1] = (previous, separator + segment)
+            continue
+        pieces[-1] = (previous, separator + segment[:lead])
+        pieces.append((chunk, segment[lead + len(chunk):]))
+    return pieces
+
+
+def _join_chunks(pieces: list[tuple[str, str]], clean: Callable[[str], str]) -> str:
+    return "".join((clean(chunk) if chunk else "") + separator for chunk, separator in pieces)
+
+
+def _build_prompt(prompt_template: str, text: str) -> str:
+    parts = _prompt_parts(prompt_template)
+    if parts is None:
+        return prompt_template.format(text=text)
+    prefix, suffix, has_text = parts
+    return prefix + text + suffix if has_text else prefix
+
+
+def warmup_llm(
+    model_name: str, use_gpu: bool, gpu_index: int = 0, quantize: bool = False
+) -> bool:
+    """Load the verification model ahead of the first :func:`verify_text` call."""
+
+    if not model_name or pipeline is None:
+        return False
+    return _get_verifier((model_name, use_gpu, gpu_index, quantize)) is not None
+
+
+class LLMSession:
+    """A verification model resolved once and reused for every :meth:`verify` call."""
+
+    __slots__ = ("model_key", "prompt_template", "_verifier")
+
+    def __init__(
+        self,
+        model_name: str,
+        use_gpu: bool,
+        prompt_template: str,
+        gpu_index: int = 0,
+        quantize: bool = False,
+    ) -> None:
+        self.model_key: ModelKey = (model_name, use_gpu, gpu_index, quantize)
+        self.prompt_template = prompt_template
+        # Loading here takes the model setup out of the first verify() call.
+        self._verifier = (
+            _get_verifier(self.model_key) if model_name and pipeline is not None else None
+        )
+
+    @property
+    def available(self) -> bool:
+        return self._verifier is not None
+
+    def verify(self, text: str) -> str:
+        """Use the session's model to clean or validate OCR output."""
+
+        verifier = self._verifier
+        if not text or verifier is None:
+            return text
+        try:
+            return _join_chunks(
+                _split_input(text),
+                lambda chunk: _cached_generate(
+                    verifier,
+                    self.model_key,
+                    _build_prompt(self.prompt_template, chunk),
+                    min(len(chunk), _MAX_NEW_TOKENS),
+                ),
+            )
+        except Exception:
+            _logger.error("LLM verification failed", exc_info=True)
+            return text
+
+    def verify_batch(self, texts: Sequence[str]) -> list[str]:
+        """Verify several OCR snippets with one batched pipeline call."""
+
+        results = list(texts)
+        verifier = self._verifier
+        if verifier is None or not any(results):
+            return results
+        if len(results) == 1:
+            # A lone snippet goes through verify() so it can hit the result cache.
+            return [self.verify(results[0])]
+
+        try:
+            prompt_template = self.prompt_template
+            text_pieces: dict[int, list[tuple[str, str]]] = {}
+            chunk_lengths: dict[str, int] = {}
+            for index, text in enumerate(results):
+                if not text:
+                    continue
+                pieces = text_pieces[index] = _split_input(text)
+                for chunk, _ in pieces:
+                    if chunk:
+                        chunk_lengths[_build_prompt(prompt_template, chunk)] = len(chunk)
+            prompts = list(chunk_lengths)
+            if not prompts:
+                return results
+            max_new_tokens = min(max(chunk_lengths.values()), _MAX_NEW_TOKENS)
+            with _inference_mode():
+                outputs = verifier(
+                    prompts,
+                    max_new_tokens=max_new_tokens,
+                    batch_size=min(len(prompts), _BATCH_SIZE),
+                    truncation=True,
+                )
+            cleaned: dict[str, str] = {}
+            for prompt, output in zip(prompts, outputs):
+                # Pipelines return one list of candidates per input when batched.
+                candidate = output[0] if isinstance(output, list) else output
+                cleaned[prompt] = candidate["generated_text"].strip()
+            for index, pieces in text_pieces.items():
+                results[index] = _join_chunks(
+                    pieces, lambda chunk: cleaned[_build_prompt(prompt_template, chunk)]
+                )
+        except Exception:
+            _logger.error("LLM batch verification failed", exc_info=True)
+            return list(texts)
+        return results
 
 
 def verify_text(
@@ -22,31 +261,27 @@ def verify_text(
     use_gpu: bool,
     prompt_template: str,
     gpu_index: int = 0,
+    quantize: bool = False,
 ) -> str:
     """Use a text-to-text model to clean or validate OCR output."""
 
     if not text or not model_name or pipeline is None:
         return text
+    return LLMSession(model_name, use_gpu, prompt_template, gpu_index, quantize).verify(text)
 
-    global _verifier
-    with _lock:
-        if _verifier is None:
-            try:
-                device = gpu_index if use_gpu else -1
-                _verifier = pipeline("text2text-generation", model=model_name, device=device)
-            except Exception:
-                _verifier = None
-                _logger.warning("Unable to load LLM model '%s'", model_name)
-                return text
-
-    if _verifier is None:
-        return text
 
-    try:
-        prompt = prompt_template.format(text=text)
-        result = _verifier(prompt, max_new_tokens=min(len(text), 128))
-        return result[0]["generated_text"].strip()
-    except Exception:
-        _logger.error("LLM verification failed", exc_info=True)
-        return text
+def verify_text_batch(
+    texts: Sequence[str],
+    model_name: str,
+    use_gpu: bool,
+    prompt_template: str,
+    gpu_index: int = 0,
+    quantize: bool = False,
+) -> list[str]:
+    """Verify several OCR snippets with one batched pipeline call."""
 
+    if not model_name or pipeline is None or not any(texts):
+        return list(texts)
+    return LLMSession(model_name, use_gpu, prompt_template, gpu_index, quantize).verify_batch(
+        texts
+    )
@@ -1,17 +1,21 @@
 """Logging helpers for ReadingRabbit."""
 from __future__ import annotations
 
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from typing import Optional
 
 _LOGGER_NAME = "readingrabbit"
+_listener: Optional[QueueListener] = None
 
 
 def setup_logging(log_path: Optional[str], log_level: str = "INFO") -> logging.Logger:
     """Configure and return the shared application logger."""
 
+    global _listener
     logger = logging.getLogger(_LOGGER_NAME)
     if logger.handlers:
         return logger
@@ -38,7 +42,12 @@ def setup_logging(log_path: Optional[str], log_level: str = "INFO") -> logging.L
         handler = logging.StreamHandler()
 
     handler.setFormatter(formatter)
-    logger.addHandler(handler)
+    # Callers only enqueue records; the listener thread does the file/stream I/O.
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    logger.addHandler(QueueHandler(log_queue))
+    _listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
     return logger
 
 
@@ -2,6 +2,9 @@
 from __future__ import annotations
 
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Mapping, Optional, Sequence
 
 import cv2
@@ -19,8 +22,14 @@ except Exception:  # pytesseract is optional but recommended
 
 _reader = None
 _reader_config: Optional[tuple[bool, tuple[str, ...], int]] = None
+_reader_thread: Optional[int] = None
+_thread_state = threading.local()
+_pool: Optional[ThreadPoolExecutor] = None
+_pool_key: Optional[tuple[object, int]] = None
 _tesseract_langs = "eng"
 _preprocess_settings: Mapping[str, object] = {}
+_use_opencl = False
+_FAST_OTSU_MIN_PIXELS = 1 << 16
 _logger = logging.getLogger("readingrabbit")
 
 
@@ -32,10 +41,13 @@ def setup_ocr(
 ) -> None:
     """Initialize the OCR reader."""
 
-    global _reader, _reader_config, _tesseract_langs, _preprocess_settings
+    global _reader, _reader_config, _reader_thread
+    global _tesseract_langs, _preprocess_settings, _use_opencl
     langs = tuple(sorted(str(lang) for lang in languages if lang)) or ("en",)
     _tesseract_langs = "+".join(langs)
     _preprocess_settings = preprocessing or {}
+    _use_opencl = use_gpu and _opencl_available()
+    _reader_thread = threading.get_ident()
 
     desired_config = (use_gpu, langs, gpu_index)
     if _reader_config == desired_config and _reader is not None:
@@ -44,7 +56,7 @@ def setup_ocr(
     _reader_config = desired_config
     if easyocr is not None:
         try:
-            _reader = easyocr.Reader(list(langs), gpu=use_gpu, gpu_device_id=gpu_index)
+            _reader = _new_reader(*desired_config)
             _logger.info("EasyOCR initialised for languages: %s", ",".join(langs))
             return
         except Exception:
@@ -54,17 +66,129 @@ def setup_ocr(
     _reader = None
 
 
+def _new_reader(use_gpu: bool, langs: tuple[str, ...], gpu_index: int):
+    return easyocr.Reader(
+        list(langs),
+        gpu=use_gpu,
+        gpu_device_id=gpu_index,
+        cudnn_benchmark=use_gpu,
+    )
+
+
+def _current_reader():
+    """Return the calling thread's EasyOCR reader, or ``None`` to use Tesseract."""
+
+    if _reader is None or threading.get_ident() == _reader_thread:
+        return _reader
+    # EasyOCR readers are not documented as thread-safe, so worker threads
+    # build their own from the configuration of the shared one. A failed build
+    # raises rather than sharing a reader across threads.
+    if getattr(_thread_state, "config", None) != _reader_config:
+        _thread_state.reader = _new_reader(*_reader_config)
+        _thread_state.config = _reader_config
+    return _thread_state.reader
+
+
+def _prepare_worker(
+    barrier: threading.Barrier, width: int, height: int, batch_size: int
+) -> bool:
+    try:
+        _current_reader()
+        warmup_ocr(width, height, batch_size)
+    except Exception:
+        _logger.warning("Per-thread EasyOCR reader unavailable", exc_info=True)
+        barrier.abort()
+        return False
+    # Holding every task until all have started puts exactly one on each thread.
+    try:
+        barrier.wait()
+    except threading.BrokenBarrierError:
+        return False
+    return True
+
+
+def ocr_pool(
+    workers: int, width: int = 0, height: int = 0, batch_size: int = 1
+) -> Optional[ThreadPoolExecutor]:
+    """Return a pool of ``workers`` OCR threads, each with its own warmed reader.
+
+    The pool and its readers are kept across runs while the reader
+    configuration is unchanged. ``None`` means OCR should run serially.
+    """
+
+    global _pool, _pool_key
+    if workers <= 1:
+        return None
+    key = (_reader_config, workers)
+    if _pool is None or _pool_key != key:
+        if _pool is not None:
+            _pool.shutdown(wait=False)
+        _pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="readingrabbit-ocr")
+        _pool_key = key
+    barrier = threading.Barrier(workers)
+    futures = [
+        _pool.submit(_prepare_worker, barrier, width, height, batch_size)
+        for _ in range(workers)
+    ]
+    if all(future.result() for future in futures):
+        return _pool
+    _logger.warning("OCR worker pool unavailable, running OCR serially")
+    _pool.shutdown(wait=False)
+    _pool = _pool_key = None
+    return None
+
+
+@lru_cache(maxsize=8)
+def _sharpen_kernel(amount: float) -> np.ndarray:
+    kernel = np.array(
+        [
+            [0.0, -amount, 0.0],
+            [-amount, 1 + (4 * amount), -amount],
+            [0.0, -amount, 0.0],
+        ],
+        dtype="float32",
+    )
+    kernel.flags.writeable = False
+    return kernel
+
+
+def _opencl_available() -> bool:
+    try:
+        if not cv2.ocl.haveOpenCL():
+            return False
+        cv2.ocl.setUseOpenCL(True)
+        return cv2.ocl.useOpenCL()
+    except Exception:
+        return False
+
+
+def _clahe(clip_limit: float, tile: int):
+    # CLAHE keeps scratch buffers between apply() calls, so each OCR thread gets its own.
+    cache = getattr(_thread_state, "clahe", None)
+    if cache is None:
+        cache = _thread_state.clahe = {}
+    clahe = cache.get((clip_limit, tile))
+    if clahe is None:
+        clahe = cache[(clip_limit, tile)] = cv2.createCLAHE(
+            clipLimit=clip_limit, tileGridSize=(tile, tile)
+        )
+    return clahe
+
+
 def _apply_common_preprocessing(frame) -> cv2.Mat:
     settings = _preprocess_settings or {}
-    work = frame
-    scale = float(settings.get("resize_scale", 1.0)) if settings else 1.0
-    if scale > 0 and abs(scale - 1.0) > 1e-3:
-        work = cv2.resize(work, None, fx=scale, fy=scale, interpolation=cv2.INTER_CUBIC)
-
-    if work.ndim == 3:
+    # With OpenCL the whole chain runs on UMat buffers and is read back once.
+    work = cv2.UMat(frame) if _use_opencl else frame
+    # Converting before resizing means the resize touches one channel, not three.
+    if frame.ndim == 3:
         gray = cv2.cvtColor(work, cv2.COLOR_BGR2GRAY)
     else:
-        gray = work.copy()
+        gray = work
+    scale = float(settings.get("resize_scale", 1.0)) if settings else 1.0
+    if scale > 0 and abs(scale - 1.0) > 1e-3:
+        gray = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_CUBIC)
+    elif gray is frame:
+        gray = frame.copy()  # later steps must not write into the caller's frame
 
     bilateral_d = int(settings.get("bilateral_diameter", 0)) if settings else 0
     if bilateral_d > 0:
@@ -75,8 +199,7 @@ def _apply_common_preprocessing(frame) -> cv2.Mat:
     clip_limit = float(settings.get("clahe_clip_limit", 0.0)) if settings else 0.0
     if clip_limit > 0:
         tile = max(1, int(settings.get("clahe_tile_grid_size", 8)))
-        clahe = cv2.createCLAHE(clipLimit=clip_limit, tileGridSize=(tile, tile))
-        gray = clahe.apply(gray)
+        gray = _clahe(clip_limit, tile).apply(gray)
 
     if bool(settings.get("use_adaptive_threshold")):
         block_size = int(settings.get("adaptive_threshold_block_size", 15))
@@ -93,23 +216,43 @@ def _apply_common_preprocessing(frame) -> cv2.Mat:
             c_val,
         )
     elif settings.get("use_otsu_threshold", True):
-        _, gray = cv2.threshold(
-            gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU
-        )
+        if (
+            settings.get("fast_otsu", True)
+            and not _use_opencl
+            and gray.size >= _FAST_OTSU_MIN_PIXELS
+        ):
+            # Otsu picks one global level; a 1-in-16 pixel sample finds the same one.
+            sample = np.ascontiguousarray(gray[::4, ::4])
+            level, _ = cv2.threshold(sample, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+            _, gray = cv2.threshold(gray, level, 255, cv2.THRESH_BINARY)
+        else:
+            _, gray = cv2.threshold(
+                gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU
+            )
 
     sharpen_amount = float(settings.get("sharpen_amount", 0.0)) if settings else 0.0
     if sharpen_amount > 0:
-        kernel = np.array(
-            [
-                [0.0, -sharpen_amount, 0.0],
-                [-sharpen_amount, 1 + (4 * sharpen_amount), -sharpen_amount],
-                [0.0, -sharpen_amount, 0.0],
-            ],
-            dtype="float32",
-        )
-        gray = cv2.filter2D(gray, -1, kernel)
+        gray = cv2.filter2D(gray, -1, _sharpen_kernel(sharpen_amount))
+
+    return gray.get() if _use_opencl else gray
 
-    return gray
+
+def warmup_ocr(width: int, height: int, batch_size: int) -> None:
+    """Run one blank batch through a GPU EasyOCR reader ahead of the real frames."""
+
+    reader = _current_reader()
+    if reader is None or _reader_config is None or not _reader_config[0]:
+        return
+    if width <= 0 or height <= 0:
+        return
+    # cuDNN autotunes per input shape, so warm up with the video's own frame size.
+    blank = _prepare_for_easyocr(np.zeros((height, width, 3), dtype=np.uint8))
+    try:
+        reader.readtext_batched(
+            [blank] * max(1, batch_size), n_width=blank.shape[1], n_height=blank.shape[0]
+        )
+    except Exception:
+        _logger.debug("EasyOCR warmup failed", exc_info=True)
 
 
 def _prepare_for_easyocr(frame) -> cv2.Mat:
@@ -120,25 +263,65 @@ def _prepare_for_easyocr(frame) -> cv2.Mat:
     return cv2.cvtColor(gray, cv2.COLOR_GRAY2BGR)
 
 
-def _prepare_for_tesseract(frame) -> cv2.Mat:
-    return _apply_common_preprocessing(frame)
+def _join_results(results) -> tuple[str, float]:
+    if not results:
+        return "", 0.0
+    text = " ".join(res[1] for res in results).strip()
+    return text, float(sum(res[2] for res in results)) / len(results)
 
 
 def extract_text(frame) -> str:
     """Run OCR on a frame using EasyOCR if available, otherwise Tesseract."""
 
-    easyocr_frame = _prepare_for_easyocr(frame)
-    if _reader is not None:
+    return extract_text_with_conf(frame)[0]
+
+
+def extract_text_with_conf(frame) -> tuple[str, float]:
+    """Like :func:`extract_text` but also return the mean confidence (0-1).
+
+    Tesseract results carry no confidence and report ``1.0``.
+    """
+
+    # Preprocess at most once; the Tesseract fallback reuses the EasyOCR pass.
+    gray = None
+    reader = _current_reader()
+    if reader is not None:
+        easyocr_frame = frame
+        if _preprocess_settings.get("apply_to_easyocr"):
+            gray = _apply_common_preprocessing(frame)
+            easyocr_frame = cv2.cvtColor(gray, cv2.COLOR_GRAY2BGR)
         try:
-            results = _reader.readtext(easyocr_frame)
-            return " ".join(res[1] for res in results).strip()
+            return _join_results(reader.readtext(easyocr_frame))
         except Exception:
             _logger.error("EasyOCR failed during extraction", exc_info=True)
-            pass
 
     if pytesseract is None:
-        return ""
+        return "", 0.0
+
+    if gray is None:
+        gray = _apply_common_preprocessing(frame)
+    text = pytesseract.image_to_string(gray, lang=_tesseract_langs)
+    return text.strip(), 1.0
+
+
+def extract_text_batch(frames: Sequence) -> list[str]:
+    """Run OCR on several frames, batching EasyOCR when their shapes match."""
+
+    return [text for text, _ in extract_text_batch_with_conf(frames)]
+
+
+def extract_text_batch_with_conf(frames: Sequence) -> list[tuple[str, float]]:
+    """Batched :func:`extract_text_with_conf`."""
+
+    reader = _current_reader()
+    if len(frames) < 2 or reader is None or len({frame.shape for frame in frames}) != 1:
+        return [extract_text_with_conf(frame) for frame in frames]
 
-    processed = _prepare_for_tesseract(frame)
-    text = pytesseract.image_to_string(processed, lang=_tesseract_langs)
-    return text.strip()
+    prepared = [_prepare_for_easyocr(frame) for frame in frames]
+    height, width = prepared[0].shape[:2]
+    try:
+        batched = reader.readtext_batched(prepared, n_width=width, n_height=height)
+        return [_join_results(results) for results in batched]
+    except Exception:
+        _logger.error("EasyOCR failed during batched extraction", exc_info=True)
+        return [extract_text_with_conf(frame) for frame in frames]
@@ -2,16 +2,20 @@
 """Resource monitoring utilities for ReadingRabbit."""
 from __future__ import annotations
 
+import atexit
 import csv
 import json
 import logging
-import statistics
+import os
+import queue
+import sys
 import time
 from datetime import datetime, timezone
 from pathlib import Path
-from threading import Event
-from typing import Callable, Dict, List, Optional, Tuple
+from threading import Event, Thread
+from typing import IO, Any, Callable, Dict, List, Optional, Set, Tuple
 
+import numpy as np
 import psutil
 
 try:
@@ -19,14 +23,73 @@ try:
 except Exception:  # GPUtil is optional at runtime
     GPUtil = None  # type: ignore
 
+try:
+    import pynvml  # type: ignore
+except Exception:  # nvidia-ml-py is optional; GPUtil is the fallback
+    pynvml = None  # type: ignore
+
 
 UpdateCallback = Callable[[float, Optional[float], Optional[float], float], None]
 AlertCallback = Callable[[str, float], None]
+LogReadyCallback = Callable[[Path], None]
+
+_METRICS = ("cpu", "ram", "gpu", "vram")
+_INITIAL_CAPACITY = 256
+_ROW_QUEUE_SIZE = 1024
+_STOP_WRITER = object()
+_LOG_HEADER = "timestamp,cpu,ram,gpu,vram\r\n"
+_LOG_BUFFER_SIZE = 64 * 1024
+
+
+_nvml_ready: Optional[bool] = None
+_nvml_handles: Dict[int, Any] = {}
+_nvml_failed: Set[int] = set()
+
+
+def _nvml_handle(index: int) -> Optional[Any]:
+    global _nvml_ready
+    if _nvml_ready is None:
+        try:
+            pynvml.nvmlInit()
+        except Exception:
+            _nvml_ready = False
+        else:
+            _nvml_ready = True
+            atexit.register(pynvml.nvmlShutdown)
+    if not _nvml_ready:
+        return None
+    handle = _nvml_handles.get(index)
+    if handle is None:
+        if index not in _nvml_failed:
+            try:
+                handle = pynvml.nvmlDeviceGetHandleByIndex(index)
+            except Exception:
+                # Remembered so a missing device is not queried again every sample.
+                _nvml_failed.add(index)
+            else:
+                _nvml_handles[index] = handle
+                return handle
+        if index == 0:
+            return None
+        return _nvml_handle(0)
+    return handle
 
 
 def get_gpu_usage(gpu_index: Optional[int] = None) -> Tuple[Optional[float], Optional[float]]:
     """Return GPU load and memory usage percentages."""
 
+    index = gpu_index if gpu_index is not None else 0
+    if pynvml is not None:
+        # NVML is an in-process library call; GPUtil spawns nvidia-smi per sample.
+        handle = _nvml_handle(index)
+        if handle is not None:
+            try:
+                util = pynvml.nvmlDeviceGetUtilizationRates(handle)
+                memory = pynvml.nvmlDeviceGetMemoryInfo(handle)
+                return float(util.gpu), memory.used * 100.0 / memory.total
+            except Exception:
+                pass
+
     if GPUtil is None:
         return None, None
     try:
@@ -35,7 +98,6 @@ def get_gpu_usage(gpu_index: Optional[int] = None) -> Tuple[Optional[float], Opt
         return None, None
     if not gpus:
         return None, None
-    index = gpu_index if gpu_index is not None else 0
     try:
         gpu = gpus[index]
     except IndexError:
@@ -43,6 +105,88 @@ def get_gpu_usage(gpu_index: Optional[int] = None) -> Tuple[Optional[float], Opt
     return gpu.load * 100, gpu.memoryUtil * 100
 
 
+class _ProcStats:
+    """Read CPU and RAM usage from ``/proc`` through descriptors kept open across ticks."""
+
+    def __init__(self) -> None:
+        self.failed = False
+        self._stat_fd = os.open("/proc/stat", os.O_RDONLY)
+        try:
+            self._meminfo_fd = os.open("/proc/meminfo", os.O_RDONLY)
+        except OSError:
+            os.close(self._stat_fd)
+            raise
+        try:
+            self._last_cpu = self._cpu_times()
+        except Exception:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        if self.failed:
+            return  # already closed; the descriptor numbers may have been reused
+        self.failed = True
+        for fd in (self._stat_fd, self._meminfo_fd):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _read(fd: int) -> bytes:
+        os.lseek(fd, 0, os.SEEK_SET)
+        return os.read(fd, 8192)
+
+    def _cpu_times(self) -> Tuple[int, int]:
+        # user nice system idle iowait irq softirq steal; guest time is already in user.
+        line = self._read(self._stat_fd).split(b"\n", 1)[0]
+        fields = [int(value) for value in line.split()[1:9]]
+        return sum(fields), fields[3] + fields[4]
+
+    def usage(self) -> Tuple[float, float]:
+        total, idle = self._cpu_times()
+        last_total, last_idle = self._last_cpu
+        self._last_cpu = (total, idle)
+        elapsed = total - last_total
+        cpu = 0.0
+        if elapsed > 0:
+            cpu = min(100.0, max(0.0, (elapsed - (idle - last_idle)) * 100.0 / elapsed))
+
+        mem_total = mem_available = 0
+        for line in self._read(self._meminfo_fd).splitlines():
+            if line.startswith(b"MemTotal:"):
+                mem_total = int(line.split()[1])
+            elif line.startswith(b"MemAvailable:"):
+                mem_available = int(line.split()[1])
+                break
+        if not mem_total:
+            raise OSError("MemTotal missing from /proc/meminfo")
+        return cpu, (mem_total - mem_available) * 100.0 / mem_total
+
+
+def _open_proc_stats() -> Optional[_ProcStats]:
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        return _ProcStats()
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def get_system_usage(proc_stats: Optional[_ProcStats] = None) -> Tuple[float, float]:
+    """Return CPU and RAM usage percentages, read through ``proc_stats`` when given."""
+
+    if proc_stats is not None and not proc_stats.failed:
+        try:
+            return proc_stats.usage()
+        except (OSError, ValueError, IndexError):
+            # Closing marks the reader failed, so later samples go straight to psutil.
+            proc_stats.close()
+            # psutil needs a priming call before cpu_percent is meaningful.
+            psutil.cpu_percent(interval=None)
+    return psutil.cpu_percent(interval=None), psutil.virtual_memory().percent
+
+
 class ResourceMonitor:
     """Monitors system resources and reports via callback."""
 
@@ -51,7 +195,7 @@ class ResourceMonitor:
         update_callback: UpdateCallback,
         interval: float,
         stop_event: Event,
-        pause_event: Event,
+        active_event: Event,
         *,
         gpu_index: Optional[int] = None,
         log_path: Optional[str] = None,
@@ -61,11 +205,12 @@ class ResourceMonitor:
         summary_path: Optional[str] = None,
         alert_log_path: Optional[str] = None,
         trend_window: float = 60.0,
+        log_ready_callback: Optional[LogReadyCallback] = None,
     ) -> None:
         self.update_callback = update_callback
         self.interval = max(0.1, float(interval))
         self.stop_event = stop_event
-        self.pause_event = pause_event
+        self.active_event = active_event
         self.gpu_index = gpu_index
         self.log_path = Path(log_path).expanduser() if log_path else None
         self.alert_thresholds = {
@@ -79,103 +224,200 @@ class ResourceMonitor:
         self.summary_path = Path(summary_path).expanduser() if summary_path else None
         self.alert_log_path = Path(alert_log_path).expanduser() if alert_log_path else None
         self.trend_window = max(10.0, float(trend_window))
-        self.samples: List[Dict[str, float]] = []
-        self.sample_times: List[float] = []
+        self.log_ready_callback = log_ready_callback
+        # One row per sample, columns ordered as _METRICS; NaN marks a missing GPU.
+        self._samples = np.full((_INITIAL_CAPACITY, len(_METRICS)), np.nan)
+        self._sample_times = np.empty(_INITIAL_CAPACITY)
+        self._sample_count = 0
         self.summary_data: Optional[Dict[str, Dict[str, float]]] = None
         self.summary_text: Optional[str] = None
         self.alert_history: List[Tuple[str, str, float]] = []
+        self.dropped_rows = 0
+        self.done = Event()
         self._logger = logging.getLogger("readingrabbit")
+        # Owned per monitor so concurrent monitors never share /proc descriptors.
+        self._proc_stats: Optional[_ProcStats] = None
+
+    @property
+    def samples(self) -> np.ndarray:
+        """Recorded samples as an ``(n, 4)`` array ordered cpu, ram, gpu, vram."""
+
+        return self._samples[: self._sample_count]
+
+    @property
+    def sample_times(self) -> np.ndarray:
+        """Monotonic timestamps matching the rows of :attr:`samples`."""
+
+        return self._sample_times[: self._sample_count]
 
     def run(self) -> None:
         csv_file = None
-        writer = None
         if self.log_path is not None:
             try:
                 self.log_path.parent.mkdir(parents=True, exist_ok=True)
-                csv_file = self.log_path.open("w", newline="", encoding="utf-8")
-                writer = csv.writer(csv_file)
-                writer.writerow(["timestamp", "cpu", "ram", "gpu", "vram"])
+                csv_file = self.log_path.open(
+                    "w", newline="", encoding="utf-8", buffering=_LOG_BUFFER_SIZE
+                )
+                csv_file.write(_LOG_HEADER)
+                csv_file.flush()
             except Exception:
                 csv_file = None
-                writer = None
+            else:
+                if self.log_ready_callback is not None:
+                    try:
+                        self.log_ready_callback(self.log_path)
+                    except Exception:
+                        self._logger.debug("Resource log callback failed", exc_info=True)
+
+        # Rows are formatted and written on a separate thread so disk latency
+        # never stretches the sampling interval.
+        row_queue: Optional[queue.Queue] = None
+        writer_thread: Optional[Thread] = None
+        if csv_file is not None:
+            row_queue = queue.Queue(maxsize=_ROW_QUEUE_SIZE)
+            writer_thread = Thread(
+                target=self._write_rows,
+                args=(row_queue, csv_file),
+                name="readingrabbit-resource-log",
+                daemon=True,
+            )
+            writer_thread.start()
 
         # Prime CPU stats to avoid the first call returning 0.0
-        psutil.cpu_percent(interval=None)
+        self._proc_stats = _open_proc_stats()
+        get_system_usage(self._proc_stats)
 
         try:
+            # Ticks are scheduled against absolute deadlines so sampling work does
+            # not stretch the interval; pausing keeps the schedule running.
+            next_tick = time.monotonic()
+            reported_lag = False
             while not self.stop_event.is_set():
-                if self.pause_event.is_set():
-                    time.sleep(self.interval)
+                if self.active_event.is_set():
+                    self._sample(row_queue)
+                next_tick += self.interval
+                delay = next_tick - time.monotonic()
+                if delay > 0:
+                    self.stop_event.wait(delay)
                     continue
-
-                cpu = psutil.cpu_percent(interval=None)
-                ram = psutil.virtual_memory().percent
-                gpu_load, gpu_mem = get_gpu_usage(self.gpu_index)
-
-                self.samples.append(
-                    {
-                        "cpu": float(cpu),
-                        "ram": float(ram),
-                        "gpu": float(gpu_load) if gpu_load is not None else float("nan"),
-                        "vram": float(gpu_mem) if gpu_mem is not None else float("nan"),
-                    }
-                )
-                self.sample_times.append(time.monotonic())
-
-                if writer is not None and csv_file is not None:
-                    timestamp = datetime.now(timezone.utc).isoformat()
-                    writer.writerow(
-                        [
-                            timestamp,
-                            f"{cpu:.2f}",
-                            f"{ram:.2f}",
-                            "" if gpu_load is None else f"{gpu_load:.2f}",
-                            "" if gpu_mem is None else f"{gpu_mem:.2f}",
-                        ]
+                # Fell behind: resynchronise instead of bursting catch-up samples.
+                next_tick = time.monotonic()
+                if not reported_lag:
+                    reported_lag = True
+                    self._logger.debug(
+                        "Resource sampling fell behind its %.2fs interval", self.interval
+                    )
+        finally:
+            try:
+                if writer_thread is not None and row_queue is not None:
+                    row_queue.put(_STOP_WRITER)
+                    writer_thread.join()
+                if csv_file is not None:
+                    csv_file.close()
+                if self.dropped_rows:
+                    self._logger.warning(
+                        "Dropped %d resource log rows; the log file could not keep up",
+                        self.dropped_rows,
                     )
+                self._finalise_summary()
+            finally:
+                if self._proc_stats is not None:
+                    self._proc_stats.close()
+                    self._proc_stats = None
+                self.done.set()
+
+    def _write_rows(self, row_queue: queue.Queue, csv_file: IO[str]) -> None:
+        # Every field is numeric, so rows are formatted directly instead of via
+        # csv.writer; the date part of the timestamp is formatted once per second.
+        cached_second = -1
+        prefix = ""
+        while True:
+            row = row_queue.get()
+            if row is _STOP_WRITER:
+                break
+            timestamp, cpu, ram, gpu_load, gpu_mem = row
+            try:
+                second = int(timestamp)
+                if second != cached_second:
+                    cached_second = second
+                    prefix = datetime.fromtimestamp(second, timezone.utc).strftime(
+                        "%Y-%m-%dT%H:%M:%S"
+                    )
+                micros = min(int((timestamp - second) * 1_000_000), 999_999)
+                gpu_text = "" if gpu_load is None else f"{gpu_load:.2f}"
+                vram_text = "" if gpu_mem is None else f"{gpu_mem:.2f}"
+                csv_file.write(
+                    f"{prefix}.{micros:06d}+00:00,{cpu:.2f},{ram:.2f},{gpu_text},{vram_text}\r\n"
+                )
+                # Flush once the backlog is drained rather than after every row.
+                if row_queue.empty():
                     csv_file.flush()
+            except Exception:
+                self._logger.debug("Failed to write resource log row", exc_info=True)
 
-                self.update_callback(cpu, gpu_load, gpu_mem, ram)
-                self._check_alerts(cpu, gpu_load, gpu_mem, ram)
+    def _sample(self, row_queue: Optional[queue.Queue]) -> None:
+        cpu, ram = get_system_usage(self._proc_stats)
+        gpu_load, gpu_mem = get_gpu_usage(self.gpu_index)
 
-                time.sleep(self.interval)
-        finally:
-            if csv_file is not None:
-                csv_file.close()
-            self._finalise_summary()
+        self._record_sample(cpu, ram, gpu_load, gpu_mem)
+
+        if row_queue is not None:
+            row = (time.time(), cpu, ram, gpu_load, gpu_mem)
+            try:
+                row_queue.put_nowait(row)
+            except queue.Full:
+                # Monitoring must never block on a slow disk.
+                self.dropped_rows += 1
+
+        self.update_callback(cpu, gpu_load, gpu_mem, ram)
+        self._check_alerts(cpu, gpu_load, gpu_mem, ram)
+
+    def _record_sample(
+        self,
+        cpu: float,
+        ram: float,
+        gpu: Optional[float],
+        vram: Optional[float],
+    ) -> None:
+        count = self._sample_count
+        if count == len(self._sample_times):
+            samples = np.full((count * 2, len(_METRICS)), np.nan)
+            samples[:count] = self._samples
+            self._samples = samples
+            self._sample_times = np.resize(self._sample_times, count * 2)
+        self._samples[count] = (
+            cpu,
+            ram,
+            np.nan if gpu is None else gpu,
+            np.nan if vram is None else vram,
+        )
+        self._sample_times[count] = time.monotonic()
+        self._sample_count = count + 1
 
     def _finalise_summary(self) -> None:
-        if not self.samples:
+        samples = self.samples
+        if not len(samples):
             return
 
         summary: Dict[str, Dict[str, float]] = {}
         trend_summary: Dict[str, float] = {}
         window_seconds = self.trend_window
-        if self.sample_times:
-            cutoff = self.sample_times[-1] - window_seconds
-        else:
-            cutoff = 0.0
+        times = self.sample_times
+        window_start = int(np.searchsorted(times, times[-1] - window_seconds))
+        valid = ~np.isnan(samples)
 
-        metrics = ("cpu", "ram", "gpu", "vram")
-        for metric in metrics:
-            values = [sample[metric] for sample in self.samples if not _is_nan(sample[metric])]
-            if not values:
+        for column, metric in enumerate(_METRICS):
+            values = samples[valid[:, column], column]
+            if not values.size:
                 continue
             summary[metric] = {
-                "average": statistics.fmean(values),
-                "maximum": max(values),
-                "minimum": min(values),
+                "average": float(values.mean()),
+                "maximum": float(values.max()),
+                "minimum": float(values.min()),
             }
-
-        for metric in metrics:
-            window_values = [
-                sample[metric]
-                for sample, timestamp in zip(self.samples, self.sample_times)
-                if timestamp >= cutoff and not _is_nan(sample[metric])
-            ]
-            if not window_values:
-                continue
-            trend_summary[metric] = window_values[-1] - window_values[0]
+            window_values = samples[window_start:, column][valid[window_start:, column]]
+            if window_values.size:
+                trend_summary[metric] = float(window_values[-1] - window_values[0])
 
         self.summary_data = summary
         lines = ["Resource Summary:"]
@@ -264,8 +506,3 @@ class ResourceMonitor:
                 except Exception:
                     # Alerts should never break monitoring
                     pass
-
-
-def _is_nan(value: float) -> bool:
-    return value != value
-
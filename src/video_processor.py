@@ -1,22 +1,143 @@
 """Video processing logic."""
 from __future__ import annotations
 
+import math
+import os
+import queue
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from threading import Event
+from threading import Event, Thread
 from typing import Callable, Optional
 
 import cv2
+import numpy as np
 
 from .config import AppConfig
-from .llm import verify_text
+from .llm import LLMSession
 from .logger import get_logger
-from .ocr import extract_text, setup_ocr
+from .ocr import (
+    extract_text_batch_with_conf,
+    extract_text_with_conf,
+    ocr_pool,
+    setup_ocr,
+    warmup_ocr,
+)
 
 
 FrameType = object  # numpy.ndarray, but keep loose typing to avoid runtime dependency
 UpdateCallback = Callable[[Optional[FrameType], float, float], None]
 
+_SIGNATURE_SIZE = 32
+_PREFETCH_FRAMES = 32
+_QUEUE_POLL_SECONDS = 0.1
+_OUTPUT_BUFFER_SIZE = 1 << 16
+_FLUSH_EVERY_FRAMES = 64
+_UI_UPDATE_PERIOD = 0.1  # seconds; caps progress callbacks at ~10 Hz
+_VERIFY_BATCH_SIZE = 16  # results already queued are verified in one model call
+_END_OF_STREAM = object()
+OcrResult = tuple[str, float]  # text and mean OCR confidence
+
+
+def _frame_signature(frame) -> np.ndarray:
+    """Return a 32x32 horizontal-gradient hash (as packed bits) of ``frame``."""
+
+    # Centre-crop to a whole multiple of the grid so INTER_AREA takes its fast
+    # integer-factor path; the few dropped edge pixels do not affect the hash.
+    height, width = frame.shape[:2]
+    crop_h = max(1, height // _SIGNATURE_SIZE) * _SIGNATURE_SIZE
+    crop_w = max(1, width // (_SIGNATURE_SIZE + 1)) * (_SIGNATURE_SIZE + 1)
+    top = max(0, (height - crop_h) // 2)
+    left = max(0, (width - crop_w) // 2)
+    frame = frame[top : top + crop_h, left : left + crop_w]
+    if frame.ndim == 3:
+        frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    small = cv2.resize(
+        frame, (_SIGNATURE_SIZE + 1, _SIGNATURE_SIZE), interpolation=cv2.INTER_AREA
+    )
+    return np.packbits(small[:, 1:] > small[:, :-1])
+
+
+def _signature_distance(left: np.ndarray, right: np.ndarray) -> int:
+    return int.from_bytes((left ^ right).tobytes(), "little").bit_count()
+
+
+def _ocr_size(width: int, height: int, max_side: int) -> tuple[int, int]:
+    """Return ``(width, height)`` scaled down so the longer side is at most ``max_side``."""
+
+    longest = max(width, height)
+    if max_side <= 0 or longest <= max_side:
+        return width, height
+    scale = max_side / longest
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+
+def _fit_for_ocr(frame, max_side: int):
+    height, width = frame.shape[:2]
+    size = _ocr_size(width, height, max_side)
+    if size == (width, height):
+        return frame
+    return cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+
+
+def _shard_bounds(total_frames: int, workers: int) -> list[tuple[int, Optional[int]]]:
+    """Split ``total_frames`` into contiguous ``(start, end)`` shards; the last reads to EOF."""
+
+    size = -(-total_frames // workers)
+    starts = list(range(0, total_frames, size))
+    return [
+        (start, start + size if index < len(starts) - 1 else None)
+        for index, start in enumerate(starts)
+    ]
+
+
+class _CudaCapture:
+    """Adapts ``cv2.cudacodec.VideoReader`` (NVDEC) to the ``VideoCapture`` read API."""
+
+    def __init__(self, path: str, max_side: int = 0) -> None:
+        self._max_side = max_side
+        self._reader = cv2.cudacodec.createVideoReader(path)
+        try:
+            self._reader.set(cv2.cudacodec.ColorFormat_BGR)
+        except Exception:
+            pass  # older builds only emit BGRA, converted in read()
+        # Decode and resize targets are allocated on first use and then reused, and
+        # all GPU work for a frame is queued on one stream and synchronised once.
+        self._stream = cv2.cuda.Stream()
+        self._decoded = cv2.cuda_GpuMat()
+        self._resized = cv2.cuda_GpuMat()
+
+    def grab(self) -> bool:
+        # Stays on the GPU; nothing is downloaded.
+        ret, _ = self._reader.nextFrame(frame=self._decoded, stream=self._stream)
+        return ret
+
+    def read(self):
+        ret, gpu_frame = self._reader.nextFrame(frame=self._decoded, stream=self._stream)
+        if not ret:
+            return False, None
+        width, height = gpu_frame.size()
+        size = _ocr_size(width, height, self._max_side)
+        if size != (width, height):
+            gpu_frame = cv2.cuda.resize(
+                gpu_frame,
+                size,
+                dst=self._resized,
+                interpolation=cv2.INTER_AREA,
+                stream=self._stream,
+            )
+        # EasyOCR and Tesseract take host arrays, so each frame is downloaded once;
+        # the host copy is fresh because queued frames are still referenced.
+        frame = gpu_frame.download(self._stream)
+        self._stream.waitForCompletion()
+        if frame.ndim == 3 and frame.shape[2] == 4:
+            frame = cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR)
+        return True, frame
+
+    def release(self) -> None:
+        self._reader = None
+        self._decoded = self._resized = None
+
 
 class VideoProcessor:
     def __init__(self, config: AppConfig, update_callback: UpdateCallback, stop_event: Event):
@@ -25,6 +146,10 @@ class VideoProcessor:
         self.update_callback = update_callback
         self.stop_event = stop_event
         self.logger = get_logger()
+        self._last_signature: Optional[np.ndarray] = None
+        self._last_result: OcrResult = ("", 0.0)
+        self._frame_step = 1.0
+        self._ocr_pool: Optional[ThreadPoolExecutor] = None
 
     def process(self) -> None:
         self.logger.info("Initialising video processor for: %s", self.config.video_path)
@@ -34,6 +159,14 @@ class VideoProcessor:
             self.config.gpu_index,
             self.config.preprocessing_for(self.config.ocr_languages),
         )
+        # Pay the model load here rather than inside the first frame's OCR pass.
+        session = LLMSession(
+            self.config.llm_model,
+            self.config.use_gpu,
+            self.config.prompt_template,
+            self.config.gpu_index,
+            self.config.llm_quantize,
+        )
         if self.config.threads:
             try:
                 cv2.setNumThreads(int(self.config.threads))
@@ -45,54 +178,387 @@ class VideoProcessor:
             raise FileNotFoundError(f"Cannot open video: {self.config.video_path}")
 
         total_frames = max(int(cap.get(cv2.CAP_PROP_FRAME_COUNT)) or 1, 1)
+        fps = float(cap.get(cv2.CAP_PROP_FPS) or 0.0)
+        sample_fps = self.config.sample_fps
+        # Only the first frame of every ``_frame_step`` frames reaches OCR.
+        self._frame_step = fps / sample_fps if 0 < sample_fps < fps else 1.0
+        sampled_frames = max(1, math.ceil(total_frames / self._frame_step))
+        decode_workers = max(1, int(self.config.decode_workers))
         self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        batch_size = max(1, int(self.config.ocr_batch_size))
+        ocr_frame_size = _ocr_size(
+            int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            self.config.ocr_max_side,
+        )
+        warmup_ocr(*ocr_frame_size, batch_size)
 
         start_time = time.time()
         frame_idx = 0
-        cancelled = False
+        self._last_signature = None
+        self._last_result = ("", 0.0)
+        queue_size = max(_PREFETCH_FRAMES, batch_size)
+        frame_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        result_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        halt = Event()
+        errors: list[BaseException] = []
+
+        if self.config.use_gpu and decode_workers == 1:
+            gpu_cap = self._open_gpu_capture()
+            if gpu_cap is not None:
+                cap.release()
+                cap = gpu_cap
+
+        # Decoding, OCR and verification/writing run as three stages connected by
+        # bounded queues, so each one overlaps with the others.
+        if decode_workers > 1 and total_frames > decode_workers:
+            decoder = Thread(
+                target=self._decode_sharded,
+                args=(cap, total_frames, decode_workers, frame_queue, halt, errors),
+                name="readingrabbit-decoder",
+                daemon=True,
+            )
+        else:
+            decoder = Thread(
+                target=self._decode_frames,
+                args=(cap, frame_queue, halt, errors),
+                name="readingrabbit-decoder",
+                daemon=True,
+            )
+        # Binary mode skips the text layer; lines are encoded once in the writer stage.
+        with self.output_path.open("wb", buffering=_OUTPUT_BUFFER_SIZE) as handle:
+            writer = Thread(
+                target=self._write_results,
+                args=(result_queue, handle, session, sampled_frames, start_time, errors),
+                name="readingrabbit-writer",
+                daemon=True,
+            )
+            decoder.start()
+            writer.start()
+            # The pool outlives this run so its per-thread readers are loaded once.
+            self._ocr_pool = ocr_pool(
+                self.config.ocr_workers,
+                *ocr_frame_size,
+                -(-batch_size // max(1, self.config.ocr_workers)),
+            )
+            try:
+                while not self.stop_event.is_set() and not errors:
+                    frames, finished = self._next_batch(frame_queue, batch_size)
+                    if frames:
+                        results = self._extract_changed(frames, frame_idx)
+                        frame_idx += len(frames)
+                        for item in zip(frames, results):
+                            result_queue.put(item)
+                    if finished:
+                        break
+            finally:
+                self._ocr_pool = None
+                halt.set()
+                result_queue.put(_END_OF_STREAM)
+                writer.join()
+                decoder.join()
+
+        cap.release()
+        if errors:
+            raise errors[0]
 
-        with self.output_path.open("w", encoding="utf-8") as handle:
-            while not self.stop_event.is_set():
+        if not self.stop_event.is_set():
+            # Ensure the final 100% update is issued for short clips.
+            self.update_callback(None, 100.0, 0.0)
+            self.logger.info("Video processing completed: %s", self.output_path)
+        else:
+            self.logger.info("Video processing cancelled")
+
+    def _open_gpu_capture(self) -> Optional[_CudaCapture]:
+        if getattr(cv2, "cudacodec", None) is None:
+            return None
+        try:
+            gpu_cap = _CudaCapture(self.config.video_path, self.config.ocr_max_side)
+        except Exception:
+            self.logger.debug("NVDEC decoding unavailable, using VideoCapture", exc_info=True)
+            return None
+        self.logger.info("Decoding video on the GPU (NVDEC)")
+        return gpu_cap
+
+    def _offer(self, target: queue.Queue, item: object, halt: Event) -> bool:
+        while not (halt.is_set() or self.stop_event.is_set()):
+            try:
+                target.put(item, timeout=_QUEUE_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _decode_frames(
+        self,
+        cap,
+        frame_queue: queue.Queue,
+        halt: Event,
+        errors: list[BaseException],
+        start: int = 0,
+        end: Optional[int] = None,
+    ) -> None:
+        # Downscaling here keeps it off the OCR stage and shrinks the queued frames.
+        fit = _fit_for_ocr if self.config.ocr_max_side > 0 else None
+        max_side = self.config.ocr_max_side
+        sampling = self._frame_step > 1
+        step = self._frame_step
+        index = start
+        try:
+            while (end is None or index < end) and not (
+                halt.is_set() or self.stop_event.is_set()
+            ):
+                # A frame is sampled when it starts a new step-sized period; the
+                # rule depends only on the global index so shards agree on it.
+                if sampling and index // step == (index - 1) // step:
+                    index += 1
+                    if not cap.grab():  # advance without colour conversion or copy
+                        break
+                    continue
                 ret, frame = cap.read()
                 if not ret:
                     break
+                index += 1
+                if fit is not None:
+                    frame = fit(frame, max_side)
+                if not self._offer(frame_queue, frame, halt):
+                    return
+        except Exception as exc:
+            errors.append(exc)
+        self._offer(frame_queue, _END_OF_STREAM, halt)
 
-                frame_idx += 1
-                try:
-                    text = extract_text(frame)
-                except Exception as exc:
-                    self.logger.error("OCR failure on frame %s: %s", frame_idx, exc)
-                    text = ""
-                if text:
-                    cleaned = verify_text(
-                        text,
-                        self.config.llm_model,
-                        self.config.use_gpu,
-                        self.config.prompt_template,
-                        self.config.gpu_index,
-                    )
-                    handle.write(cleaned + "\n")
-                    handle.flush()
-
-                progress = min(100.0, (frame_idx / total_frames) * 100)
-                elapsed = time.time() - start_time
-                fps = frame_idx / elapsed if elapsed > 0 else 0.0
-                eta = max(0.0, (total_frames - frame_idx) / fps) if fps > 0 else 0.0
-
-                self.update_callback(frame, progress, eta)
+    def _decode_sharded(
+        self,
+        cap,
+        total_frames: int,
+        workers: int,
+        frame_queue: queue.Queue,
+        halt: Event,
+        errors: list[BaseException],
+    ) -> None:
+        """Decode contiguous shards on separate captures and forward them in order."""
+
+        shards = _shard_bounds(total_frames, workers)
+        shard_queues = [queue.Queue(maxsize=frame_queue.maxsize) for _ in shards]
+        threads = [
+            Thread(
+                target=self._decode_shard,
+                # The probing capture already sits at frame 0, so it serves shard 0.
+                args=(cap if index == 0 else None, start, end, shard_queue, halt, errors),
+                name=f"readingrabbit-decoder-{index}",
+                daemon=True,
+            )
+            for index, ((start, end), shard_queue) in enumerate(zip(shards, shard_queues))
+        ]
+        for thread in threads:
+            thread.start()
+        try:
+            for shard_queue in shard_queues:
+                while True:
+                    try:
+                        frame = shard_queue.get(timeout=_QUEUE_POLL_SECONDS)
+                    except queue.Empty:
+                        if halt.is_set() or self.stop_event.is_set():
+                            return
+                        continue
+                    if frame is _END_OF_STREAM:
+                        break
+                    if not self._offer(frame_queue, frame, halt):
+                        return
+        except Exception as exc:
+            errors.append(exc)
+        finally:
+            for thread in threads:
+                thread.join()
+        self._offer(frame_queue, _END_OF_STREAM, halt)
 
+    def _decode_shard(
+        self,
+        cap,
+        start: int,
+        end: Optional[int],
+        shard_queue: queue.Queue,
+        halt: Event,
+        errors: list[BaseException],
+    ) -> None:
+        owned = cap is None
+        try:
+            if owned:
+                cap = cv2.VideoCapture(self.config.video_path)
+                if not cap.isOpened():
+                    raise FileNotFoundError(f"Cannot open video: {self.config.video_path}")
+                cap.set(cv2.CAP_PROP_POS_FRAMES, start)
+        except Exception as exc:
+            errors.append(exc)
+            self._offer(shard_queue, _END_OF_STREAM, halt)
+            return
+        try:
+            self._decode_frames(cap, shard_queue, halt, errors, start, end)
+        finally:
+            if owned:
+                cap.release()
+
+    def _next_batch(self, frame_queue: queue.Queue, batch_size: int) -> tuple[list, bool]:
+        frames: list = []
+        while len(frames) < batch_size:
+            try:
+                frame = frame_queue.get(timeout=_QUEUE_POLL_SECONDS)
+            except queue.Empty:
                 if self.stop_event.is_set():
-                    cancelled = True
+                    return frames, True
+                continue
+            if frame is _END_OF_STREAM:
+                return frames, True
+            frames.append(frame)
+        return frames, False
+
+    def _write_results(
+        self,
+        result_queue: queue.Queue,
+        handle,
+        session: LLMSession,
+        total_frames: int,
+        start_time: float,
+        errors: list[BaseException],
+    ) -> None:
+        # Per-frame constants are bound once; this loop runs for every decoded frame.
+        config = self.config
+        verify_batch = session.verify_batch
+        # Without a model every caption is written as-is, so the gating work is skipped.
+        verify_enabled = session.available
+        min_letters = config.min_text_chars_for_llm
+        min_confidence = config.min_ocr_confidence_for_llm
+        stop_is_set = self.stop_event.is_set
+        update_callback = self.update_callback
+        write = handle.write
+        # Text mode would turn every "\n" into os.linesep, including those inside
+        # multi-line OCR/LLM output, so the same translation is applied here.
+        linesep = os.linesep
+        translate_newlines = linesep != "\n"
+        line_end = linesep.encode("ascii")
+        percent_per_frame = 100.0 / total_frames
+        next_update = 0.0
+        frame_idx = 0
+        last_text: Optional[str] = None
+        last_cleaned = ""
+        get_queued = result_queue.get_nowait
+        finished = False
+        while not finished:
+            group = [result_queue.get()]
+            while len(group) < _VERIFY_BATCH_SIZE and group[-1] is not _END_OF_STREAM:
+                try:
+                    group.append(get_queued())
+                except queue.Empty:
                     break
+            if group[-1] is _END_OF_STREAM:
+                group.pop()
+                finished = True
+            if errors or stop_is_set():
+                continue  # keep draining so the OCR stage never blocks
+            try:
+                # First pass picks the captions to verify so they share one model call.
+                use_verified = [False] * len(group)
+                verified: dict[str, str] = {}
+                if verify_enabled:
+                    for position, (_, (text, confidence)) in enumerate(group):
+                        if not text:
+                            continue
+                        if text == last_text:
+                            # Consecutive repeat of a verified caption.
+                            use_verified[position] = True
+                        elif (
+                            confidence >= min_confidence
+                            and sum(char.isalpha() for char in text) >= min_letters
+                        ):
+                            # Short or low-confidence hits are not worth an LLM pass.
+                            use_verified[position] = True
+                            verified[text] = ""
+                            last_text = text
+                    if verified:
+                        pending = list(verified)
+                        verified = dict(zip(pending, verify_batch(pending)))
+                for position, (frame, (text, _)) in enumerate(group):
+                    frame_idx += 1
+                    if text:
+                        if not use_verified[position]:
+                            cleaned = text
+                        else:
+                            # Only a repeat of the previous group's last caption is missing here.
+                            cleaned = verified.get(text, last_cleaned)
+                        if translate_newlines:
+                            cleaned = cleaned.replace("\n", linesep)
+                        write(cleaned.encode("utf-8") + line_end)
+                    # Periodic flush for crash resilience; closing the file flushes the rest.
+                    if frame_idx % _FLUSH_EVERY_FRAMES == 0:
+                        handle.flush()
 
-            else:
-                cancelled = True
+                    now = time.monotonic()
+                    if now < next_update and frame_idx < total_frames:
+                        continue
+                    next_update = now + _UI_UPDATE_PERIOD
 
-        cap.release()
+                    progress = min(100.0, frame_idx * percent_per_frame)
+                    elapsed = time.time() - start_time
+                    fps = frame_idx / elapsed if elapsed > 0 else 0.0
+                    eta = max(0.0, (total_frames - frame_idx) / fps) if fps > 0 else 0.0
 
-        if not cancelled and not self.stop_event.is_set():
-            # Ensure the final 100% update is issued for short clips.
-            self.update_callback(None, 100.0, 0.0)
-            self.logger.info("Video processing completed: %s", self.output_path)
-        elif cancelled:
-            self.logger.info("Video processing cancelled")
+                    update_callback(frame, progress, eta)
+                if last_text in verified:
+                    last_cleaned = verified[last_text]
+            except Exception as exc:
+                errors.append(exc)
+
+    def _extract_changed(self, frames: list, first_idx: int) -> list[OcrResult]:
+        """OCR only frames that differ from the last OCR'd one; others reuse its text."""
+
+        threshold = self.config.scene_change_threshold
+        if threshold <= 0:
+            return self._extract_texts(frames, range(first_idx + 1, first_idx + len(frames) + 1))
+
+        changed: list = []
+        changed_numbers: list[int] = []
+        # Index into ``changed`` whose text each frame uses; -1 is the previous batch.
+        sources: list[int] = []
+        for number, frame in enumerate(frames, start=first_idx + 1):
+            signature = _frame_signature(frame)
+            if (
+                self._last_signature is None
+                or _signature_distance(signature, self._last_signature) >= threshold
+            ):
+                self._last_signature = signature
+                changed.append(frame)
+                changed_numbers.append(number)
+            sources.append(len(changed) - 1)
+
+        results = self._extract_texts(changed, changed_numbers) if changed else []
+        previous = self._last_result
+        if results:
+            self._last_result = results[-1]
+        return [results[source] if source >= 0 else previous for source in sources]
+
+    def _extract_texts(self, frames: list, frame_numbers) -> list[OcrResult]:
+        pool = self._ocr_pool
+        if pool is not None and len(frames) >= 2:
+            try:
+                # Each worker OCRs one contiguous slice; map() keeps them in order.
+                size = -(-len(frames) // self.config.ocr_workers)
+                slices = [frames[start : start + size] for start in range(0, len(frames), size)]
+                parts = pool.map(extract_text_batch_with_conf, slices)
+                return [result for part in parts for result in part]
+            except Exception:
+                # A failing worker would fail again, so the rest of the run stays serial.
+                self.logger.warning("OCR worker pool failed, running OCR serially", exc_info=True)
+                self._ocr_pool = None
+        try:
+            return extract_text_batch_with_conf(frames)
+        except Exception:
+            pass
+        # Retry frame by frame so one bad frame does not blank the whole batch.
+        results: list[OcrResult] = []
+        for number, frame in zip(frame_numbers, frames):
+            try:
+                results.append(extract_text_with_conf(frame))
+            except Exception as exc:
+                self.logger.error("OCR failure on frame %s: %s", number, exc)
+                results.append(("", 0.0))
+        return results
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import pickle
 from pathlib import Path
 
-from src.config import load_config
+import pytest
+
+from src import config as config_module
+from src.config import AppConfig, load_config
 
 
 def test_load_config_with_preprocessing(tmp_path: Path) -> None:
@@ -51,3 +55,115 @@ ocr_preprocessing:
     default_processing = config.preprocessing_for(["fr"])
     assert default_processing["resize_scale"] == 1.4
     assert default_processing["use_otsu_threshold"] is False
+
+
+def test_load_config_cache_invalidates_on_change(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("video_path: first.mp4\noutput_text_path: out.txt\n", encoding="utf-8")
+
+    first = load_config(config_path)
+    assert first.video_path == "first.mp4"
+    assert (tmp_path / "config.yaml.cache").exists()
+    assert load_config(config_path).video_path == "first.mp4"
+
+    config_path.write_text(
+        "video_path: second_video.mp4\noutput_text_path: out.txt\n", encoding="utf-8"
+    )
+    assert load_config(config_path).video_path == "second_video.mp4"
+
+
+def test_load_config_is_served_from_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("video_path: a.mp4\noutput_text_path: out.txt\n", encoding="utf-8")
+    parse_calls = []
+    parse_config = config_module._parse_config
+
+    def counting_parse(path: Path) -> AppConfig:
+        parse_calls.append(path)
+        return parse_config(path)
+
+    monkeypatch.setattr(config_module, "_parse_config", counting_parse)
+
+    load_config(config_path)
+    assert load_config(config_path).video_path == "a.mp4"  # in-memory cache
+    config_module._memory_cache.clear()
+    assert load_config(config_path).video_path == "a.mp4"  # sidecar file
+    assert len(parse_calls) == 1
+
+
+def test_load_config_cache_ignores_other_cpu_counts(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(
+        "video_path: a.mp4\noutput_text_path: out.txt\nthreads: 64\n", encoding="utf-8"
+    )
+    monkeypatch.setattr(config_module, "_available_cpus", lambda: 4)
+    assert load_config(config_path).threads == 3
+
+    config_module._memory_cache.clear()
+    monkeypatch.setattr(config_module, "_available_cpus", lambda: 9)
+    assert load_config(config_path).threads == 8
+
+
+def test_app_config_round_trips_through_pickle() -> None:
+    config = AppConfig(video_path="a.mp4", output_text_path="out.txt", ocr_languages=["en", "ja"])
+
+    restored = pickle.loads(pickle.dumps(config))
+
+    assert restored == config
+    assert restored.monitor_gpu_index == config.monitor_gpu_index
+
+
+def test_load_config_from_toml(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.toml"
+    config_path.write_text(
+        """
+video_path = "clip.mp4"
+output_text_path = "out.txt"
+threads = 2
+ui_layout = "Compact"
+
+[resource_alerts]
+cpu = 80
+        """,
+        encoding="utf-8",
+    )
+
+    config = load_config(config_path)
+
+    assert config.video_path == "clip.mp4"
+    assert config.ui_layout == "compact"
+    assert config.resource_alerts == {"cpu": 80.0}
+
+
+def test_load_config_ignores_unknown_keys(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(
+        "video_path: a.mp4\noutput_text_path: out.txt\nlegacy_option: true\n",
+        encoding="utf-8",
+    )
+
+    config = load_config(config_path)
+
+    assert config.video_path == "a.mp4"
+    assert not hasattr(config, "legacy_option")
+
+
+def test_app_config_derived_values_follow_later_edits() -> None:
+    config = AppConfig(
+        video_path="in.mp4",
+        output_text_path="out.txt",
+        themes={"dark": {"background": "#000"}, "light": {"background": "#fff"}},
+        ocr_preprocessing={"en": {"resize_scale": 2.0}},
+    )
+    assert config.preprocessing_for(["en"]) == {"resize_scale": 2.0}
+
+    config.ui_theme = "light"
+    config.use_gpu = False
+    config.ocr_preprocessing = {"default": {"resize_scale": 1.5}}
+
+    assert config.theme() == {"background": "#fff"}
+    assert config.resolved_theme == {"background": "#fff"}
+    assert config.monitor_gpu_index is None
+    assert config.preprocessing_for(["en"]) == {"resize_scale": 1.5}
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Iterator, List
+
+import pytest
+
+from src import llm
+
+
+class FakePipeline:
+    def __init__(self) -> None:
+        self.calls: List[object] = []
+
+    def __call__(self, prompts, **kwargs):
+        self.calls.append(prompts)
+        if isinstance(prompts, list):
+            return [[{"generated_text": f" {prompt.upper()} "}] for prompt in prompts]
+        return [{"generated_text": f" {prompts.upper()} "}]
+
+
+@pytest.fixture()
+def fake_pipeline(monkeypatch: pytest.MonkeyPatch) -> Iterator[FakePipeline]:
+    fake = FakePipeline()
+    monkeypatch.setattr(llm, "pipeline", lambda *args, **kwargs: fake)
+    llm._build_verifier.cache_clear()
+    llm._result_cache.clear()
+    yield fake
+    llm._build_verifier.cache_clear()
+    llm._result_cache.clear()
+
+
+def test_verify_text_caches_repeated_prompts(fake_pipeline: FakePipeline) -> None:
+    assert llm.warmup_llm("model", use_gpu=False)
+    assert llm.verify_text("header", "model", False, "fix: {text}") == "FIX: HEADER"
+    assert llm.verify_text("header", "model", False, "fix: {text}") == "FIX: HEADER"
+    assert fake_pipeline.calls == ["fix: header"]
+
+
+def test_verify_text_batch_keeps_positions(fake_pipeline: FakePipeline) -> None:
+    result = llm.verify_text_batch(["a", "", "b", "a"], "model", False, "{text}")
+
+    assert result == ["A", "", "B", "A"]
+    assert fake_pipeline.calls == [["a", "b"]]
+
+
+def test_verify_text_splits_long_input(
+    fake_pipeline: FakePipeline, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(llm, "_MAX_INPUT_CHARS", 8)
+
+    assert llm.verify_text("alpha beta gamma", "model", False, "{text}") == "ALPHA BETA GAMMA"
+    assert fake_pipeline.calls == ["alpha", "beta", "gamma"]
+
+
+def test_verify_text_keeps_separators_between_chunks(
+    fake_pipeline: FakePipeline, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(llm, "_MAX_INPUT_CHARS", 8)
+
+    assert llm.verify_text(" alpha\nbeta\n\ngamma ", "model", False, "{text}") == (
+        " ALPHA\nBETA\n\nGAMMA "
+    )
+    assert llm.verify_text(" " * 20, "model", False, "{text}") == " " * 20
+    assert llm.verify_text_batch(["alpha\nbeta", "   "], "model", False, "{text}") == [
+        "ALPHA\nBETA",
+        "   ",
+    ]
+
+
+def test_llm_session_verifies_with_bound_model(fake_pipeline: FakePipeline) -> None:
+    session = llm.LLMSession("model", False, "fix: {text}")
+    assert session.available
+    assert session.verify("header") == "FIX: HEADER"
+    assert session.verify("") == ""
+    assert not llm.LLMSession("", False, "{text}").available
+
+
+def test_llm_session_skips_model_lookup_per_caption(
+    fake_pipeline: FakePipeline, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    session = llm.LLMSession("model", False, "fix: {text}")
+
+    def unexpected_lookup(model_key):
+        raise AssertionError("verify() resolved the model again")
+
+    monkeypatch.setattr(llm, "_get_verifier", unexpected_lookup)
+    assert session.verify("footer") == "FIX: FOOTER"
+    assert session.verify("footer") == "FIX: FOOTER"
+    assert fake_pipeline.calls == ["fix: footer"]
+
+
+def test_model_dtype_keeps_float32_without_bf16(monkeypatch: pytest.MonkeyPatch) -> None:
+    cuda = SimpleNamespace(is_bf16_supported=lambda: False)
+    monkeypatch.setattr(llm, "torch", SimpleNamespace(cuda=cuda, bfloat16="bf16"))
+
+    assert llm._model_dtype(use_gpu=True) is None
+    cuda.is_bf16_supported = lambda: True
+    assert llm._model_dtype(use_gpu=True) == "bf16"
+    assert llm._model_dtype(use_gpu=False) is None
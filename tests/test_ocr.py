@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import threading
+from typing import Iterator, List
+
+import numpy as np
+import pytest
+
+from src import ocr
+
+
+class FakeReader:
+    def __init__(self) -> None:
+        self.thread = threading.get_ident()
+        self.warmups = 0
+
+    def readtext_batched(self, frames, **kwargs):
+        self.warmups += 1
+        return [[] for _ in frames]
+
+
+@pytest.fixture()
+def fake_readers(monkeypatch: pytest.MonkeyPatch) -> Iterator[List[FakeReader]]:
+    built: List[FakeReader] = []
+
+    def new_reader(*config) -> FakeReader:
+        built.append(FakeReader())
+        return built[-1]
+
+    monkeypatch.setattr(ocr, "_new_reader", new_reader)
+    monkeypatch.setattr(ocr, "_reader", FakeReader())
+    monkeypatch.setattr(ocr, "_reader_config", (True, ("en",), 0))
+    monkeypatch.setattr(ocr, "_reader_thread", threading.get_ident())
+    monkeypatch.setattr(ocr, "_preprocess_settings", {})
+    yield built
+    if ocr._pool is not None:
+        ocr._pool.shutdown(wait=True)
+    ocr._pool = ocr._pool_key = None
+
+
+def test_ocr_pool_keeps_warmed_readers_across_runs(fake_readers: List[FakeReader]) -> None:
+    pool = ocr.ocr_pool(2, 64, 32, 1)
+
+    assert pool is not None
+    assert ocr.ocr_pool(2, 64, 32, 1) is pool
+    assert len(fake_readers) == 2
+    assert len({reader.thread for reader in fake_readers}) == 2
+    assert all(reader.warmups == 2 for reader in fake_readers)
+
+
+def test_ocr_pool_falls_back_to_serial_when_a_reader_fails(
+    fake_readers: List[FakeReader], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def failing_reader(*config):
+        raise RuntimeError("out of GPU memory")
+
+    monkeypatch.setattr(ocr, "_new_reader", failing_reader)
+
+    assert ocr.ocr_pool(2, 64, 32, 1) is None
+    assert ocr._pool is None
+
+
+def test_ocr_pool_gives_each_worker_its_own_clahe(
+    fake_readers: List[FakeReader], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(ocr, "_preprocess_settings", {"clahe_clip_limit": 2.0})
+    rng = np.random.default_rng(0)
+    frames = [rng.integers(0, 256, (48, 64), dtype=np.uint8) for _ in range(8)]
+    expected = [ocr._apply_common_preprocessing(frame) for frame in frames]
+
+    pool = ocr.ocr_pool(2, 64, 48, 1)
+    assert pool is not None
+    barrier = threading.Barrier(2)
+
+    def worker_clahe(_) -> int:
+        barrier.wait(timeout=5)  # forces one call onto each worker thread
+        return id(ocr._clahe(2.0, 8))
+
+    clahes = set(pool.map(worker_clahe, range(2)))
+    results = list(pool.map(ocr._apply_common_preprocessing, frames * 8))
+
+    assert len(clahes) == 2
+    assert id(ocr._clahe(2.0, 8)) not in clahes
+    assert all(np.array_equal(result, expected[i % 8]) for i, result in enumerate(results))
@@ -15,22 +15,20 @@ def test_resource_monitor_writes_summary(tmp_path: Path, monkeypatch: pytest.Mon
     cpu_sequence = [10.0, 25.0, 60.0, 45.0, 30.0]
     call_index = {"count": 0}
 
-    def fake_cpu_percent(interval=None):  # type: ignore[override]
+    def fake_system_usage(proc_stats=None):
         value = cpu_sequence[min(call_index["count"], len(cpu_sequence) - 1)]
         call_index["count"] += 1
-        return value
+        return value, 40.0
 
-    def fake_virtual_memory():  # type: ignore[override]
-        return SimpleNamespace(percent=40.0)
-
-    monkeypatch.setattr(resource_monitor.psutil, "cpu_percent", fake_cpu_percent)
-    monkeypatch.setattr(resource_monitor.psutil, "virtual_memory", fake_virtual_memory)
+    monkeypatch.setattr(resource_monitor, "get_system_usage", fake_system_usage)
     monkeypatch.setattr(resource_monitor, "get_gpu_usage", lambda gpu_index: (50.0, 55.0))
 
     stop_event = threading.Event()
-    pause_event = threading.Event()
+    active_event = threading.Event()
+    active_event.set()
     metrics: List[float] = []
     alerts: List[str] = []
+    ready_logs: List[Path] = []
 
     def update_callback(cpu, gpu, vram, ram):
         metrics.append(cpu)
@@ -47,7 +45,7 @@ def test_resource_monitor_writes_summary(tmp_path: Path, monkeypatch: pytest.Mon
         update_callback=update_callback,
         interval=0.01,
         stop_event=stop_event,
-        pause_event=pause_event,
+        active_event=active_event,
         gpu_index=None,
         log_path=tmp_path / "samples.csv",
         alert_thresholds={"cpu": 20},
@@ -56,6 +54,7 @@ def test_resource_monitor_writes_summary(tmp_path: Path, monkeypatch: pytest.Mon
         summary_path=str(summary_path),
         alert_log_path=str(alert_path),
         trend_window=0.05,
+        log_ready_callback=ready_logs.append,
     )
 
     thread = threading.Thread(target=monitor.run, daemon=True)
@@ -68,3 +67,82 @@ def test_resource_monitor_writes_summary(tmp_path: Path, monkeypatch: pytest.Mon
     assert summary_path.exists()
     assert alert_path.exists()
     assert alerts, "Alert callback should have fired"
+    assert ready_logs == [tmp_path / "samples.csv"]
+    rows = (tmp_path / "samples.csv").read_text(encoding="utf-8").splitlines()
+    assert len(rows) == len(metrics) + 1
+
+
+def test_get_system_usage_falls_back_to_psutil(monkeypatch: pytest.MonkeyPatch) -> None:
+    class FailingStats:
+        failed = False
+
+        def usage(self):
+            raise OSError("/proc is not mounted")
+
+        def close(self) -> None:
+            self.failed = True
+
+    monkeypatch.setattr(resource_monitor.psutil, "cpu_percent", lambda interval=None: 12.5)
+    monkeypatch.setattr(
+        resource_monitor.psutil, "virtual_memory", lambda: SimpleNamespace(percent=40.0)
+    )
+
+    stats = FailingStats()
+    assert resource_monitor.get_system_usage() == (12.5, 40.0)
+    assert resource_monitor.get_system_usage(stats) == (12.5, 40.0)
+    assert stats.failed
+
+
+def test_nvml_handle_caches_missing_devices(monkeypatch: pytest.MonkeyPatch) -> None:
+    lookups: List[int] = []
+
+    def get_handle(index: int) -> str:
+        lookups.append(index)
+        if index != 0:
+            raise RuntimeError("no such device")
+        return "gpu0"
+
+    fake_nvml = SimpleNamespace(nvmlDeviceGetHandleByIndex=get_handle)
+    monkeypatch.setattr(resource_monitor, "pynvml", fake_nvml)
+    monkeypatch.setattr(resource_monitor, "_nvml_ready", True)
+    monkeypatch.setattr(resource_monitor, "_nvml_handles", {})
+    monkeypatch.setattr(resource_monitor, "_nvml_failed", set())
+
+    assert resource_monitor._nvml_handle(3) == "gpu0"
+    assert resource_monitor._nvml_handle(3) == "gpu0"
+    assert lookups == [3, 0]
+
+
+def test_resource_monitor_skips_samples_while_inactive(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(resource_monitor, "get_system_usage", lambda proc_stats=None: (1.0, 2.0))
+    monkeypatch.setattr(resource_monitor, "get_gpu_usage", lambda gpu_index: (None, None))
+    stop_event = threading.Event()
+    active_event = threading.Event()
+    samples: List[float] = []
+
+    monitor = ResourceMonitor(lambda *values: samples.append(values[0]), 0.1, stop_event, active_event)
+    thread = threading.Thread(target=monitor.run, daemon=True)
+    thread.start()
+    stop_event.wait(0.35)
+    stop_event.set()
+    thread.join(timeout=2)
+
+    assert samples == []
+
+
+def test_proc_stats_closes_descriptors_when_priming_fails(monkeypatch: pytest.MonkeyPatch) -> None:
+    opened: List[int] = []
+    closed: List[int] = []
+
+    def fake_open(path: str, flags: int) -> int:
+        opened.append(len(opened))
+        return opened[-1]
+
+    monkeypatch.setattr(resource_monitor.os, "open", fake_open)
+    monkeypatch.setattr(resource_monitor.os, "close", closed.append)
+    monkeypatch.setattr(resource_monitor._ProcStats, "_read", staticmethod(lambda fd: b"cpu x\n"))
+
+    with pytest.raises(ValueError):
+        resource_monitor._ProcStats()
+
+    assert sorted(closed) == opened == [0, 1]
@@ -1,23 +1,48 @@
 from __future__ import annotations
 
+import io
+import queue
 import sys
 import threading
 import types
 from pathlib import Path
-from typing import List
+from typing import Callable, List
 
+import numpy as np
 import pytest
 
 fake_cv2 = types.SimpleNamespace(
     VideoCapture=lambda *args, **kwargs: None,
     CAP_PROP_FRAME_COUNT=0,
+    CAP_PROP_FRAME_WIDTH=3,
+    CAP_PROP_FRAME_HEIGHT=4,
+    CAP_PROP_POS_FRAMES=1,
+    CAP_PROP_FPS=5,
     setNumThreads=lambda value: None,
 )
 
 sys.modules.setdefault("cv2", fake_cv2)
 
 from src.config import AppConfig
-from src.video_processor import VideoProcessor
+from src.video_processor import _END_OF_STREAM, VideoProcessor
+
+
+def fake_session(verify):
+    """Build an LLMSession stand-in that forwards to ``verify(text, *session_args)``."""
+
+    class FakeSession:
+        available = True
+
+        def __init__(self, *args) -> None:
+            self.args = args
+
+        def verify(self, text: str) -> str:
+            return verify(text, *self.args)
+
+        def verify_batch(self, texts):
+            return [verify(text, *self.args) for text in texts]
+
+    return FakeSession
 
 
 class DummyCapture:
@@ -43,56 +68,260 @@ class DummyCapture:
             return len(self._frames)
         return 0
 
+    def grab(self) -> bool:
+        if self._index >= len(self._frames):
+            return False
+        self._index += 1
+        return True
+
+    def set(self, prop, value) -> bool:
+        self._index = int(value)
+        return True
+
     def release(self) -> None:
         self.opened = False
 
 
-def test_video_processor_generates_output(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
-    frames = [object() for _ in range(5)]
-    capture = DummyCapture(frames)
+@pytest.fixture()
+def run_processor(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    """Run a VideoProcessor over fake captures and OCR; returns the output path."""
+
+    def run(
+        capture,
+        ocr_batch: Callable,
+        *,
+        verify: Callable = lambda text, *args: text,
+        setup_ocr: Callable = lambda *args: None,
+        update_callback: Callable = lambda *args: None,
+        **config_overrides,
+    ) -> Path:
+        open_capture = capture if callable(capture) else lambda path: capture
+        monkeypatch.setattr("src.video_processor.cv2.VideoCapture", open_capture)
+        monkeypatch.setattr(
+            "src.video_processor.cv2.CAP_PROP_FRAME_COUNT", DummyCapture.CAP_PROP_FRAME_COUNT
+        )
+        monkeypatch.setattr("src.video_processor.cv2.CAP_PROP_FPS", 5)
+        monkeypatch.setattr("src.video_processor.cv2.setNumThreads", lambda value: None)
+        monkeypatch.setattr("src.video_processor.setup_ocr", setup_ocr)
+        monkeypatch.setattr("src.video_processor.extract_text_batch_with_conf", ocr_batch)
+        monkeypatch.setattr(
+            "src.video_processor.extract_text_with_conf", lambda frame: ocr_batch([frame])[0]
+        )
+        monkeypatch.setattr("src.video_processor.LLMSession", fake_session(verify))
+
+        output_path = tmp_path / "output.txt"
+        settings = {"use_gpu": False, "ocr_max_side": 0, "scene_change_threshold": 0}
+        settings.update(config_overrides)
+        config = AppConfig(video_path="input.mp4", output_text_path=str(output_path), **settings)
+        processor = VideoProcessor(
+            config=config, update_callback=update_callback, stop_event=threading.Event()
+        )
+        processor.process()
+        return output_path
 
-    class CaptureFactory:
-        CAP_PROP_FRAME_COUNT = DummyCapture.CAP_PROP_FRAME_COUNT
+    return run
 
-        def __call__(self, path: str):
-            assert path == "input.mp4"
-            return capture
 
-    capture_factory = CaptureFactory()
+def frame_texts(batch):
+    return [(f"frame text {frame}", 0.9) for frame in batch]
+
+
+def test_video_processor_generates_output(run_processor) -> None:
+    frames = [object() for _ in range(5)]
+    capture = DummyCapture(frames)
+    updates: List[float] = []
 
-    def fake_extract_text(frame) -> str:
-        return "frame_text"
+    def open_capture(path: str) -> DummyCapture:
+        assert path == "input.mp4"
+        return capture
 
     def fake_setup_ocr(use_gpu: bool, languages, gpu_index: int, preprocessing) -> None:
         assert languages == ["en"]
 
-    def fake_verify_text(text: str, model: str, use_gpu: bool, prompt: str, gpu_index: int) -> str:
+    def fake_verify_text(
+        text: str, model: str, use_gpu: bool, prompt: str, gpu_index: int, quantize: bool
+    ) -> str:
         return text.upper()
 
-    monkeypatch.setattr("src.video_processor.cv2.VideoCapture", capture_factory)
-    monkeypatch.setattr("src.video_processor.cv2.CAP_PROP_FRAME_COUNT", DummyCapture.CAP_PROP_FRAME_COUNT)
-    monkeypatch.setattr("src.video_processor.cv2.setNumThreads", lambda value: None)
-    monkeypatch.setattr("src.video_processor.extract_text", fake_extract_text)
-    monkeypatch.setattr("src.video_processor.setup_ocr", fake_setup_ocr)
-    monkeypatch.setattr("src.video_processor.verify_text", fake_verify_text)
-
-    output_path = tmp_path / "output.txt"
-    config = AppConfig(
-        video_path="input.mp4",
-        output_text_path=str(output_path),
-        use_gpu=False,
+    output_path = run_processor(
+        open_capture,
+        lambda batch: [("frame_text", 0.9) for _ in batch],
+        verify=fake_verify_text,
+        setup_ocr=fake_setup_ocr,
+        update_callback=lambda frame, progress, eta: updates.append(progress),
         ocr_languages=["en"],
+        ocr_batch_size=2,
     )
 
-    updates: List[float] = []
-
-    def update_callback(frame, progress: float, eta: float) -> None:
-        updates.append(progress)
-
-    processor = VideoProcessor(config=config, update_callback=update_callback, stop_event=threading.Event())
-    processor.process()
-
     assert output_path.exists()
     content = output_path.read_text(encoding="utf-8").strip().splitlines()
     assert content == ["FRAME_TEXT" for _ in frames]
     assert updates[-1] == pytest.approx(100.0)
+
+
+def test_video_processor_reuses_text_for_unchanged_frames(
+    run_processor, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    ocr_calls: List[object] = []
+
+    def fake_extract_batch(batch):
+        ocr_calls.extend(batch)
+        return [(f"text_{frame}", 0.9) for frame in batch]
+
+    monkeypatch.setattr(
+        "src.video_processor._frame_signature",
+        lambda frame: np.packbits(np.full(64, frame == "b")),
+    )
+
+    output_path = run_processor(
+        DummyCapture(["a", "a", "b", "b", "b"]),
+        fake_extract_batch,
+        ocr_batch_size=2,
+        scene_change_threshold=3,
+    )
+
+    assert ocr_calls == ["a", "b"]
+    content = output_path.read_text(encoding="utf-8").splitlines()
+    assert content == ["text_a", "text_a", "text_b", "text_b", "text_b"]
+
+
+def test_video_processor_skips_llm_for_short_or_uncertain_text(run_processor) -> None:
+    ocr_results = [("ok", 0.9), ("Hello world", 0.2), ("Hello world", 0.9), ("Hello world", 0.9)]
+    verified: List[str] = []
+
+    def fake_verify_text(text: str, *args) -> str:
+        verified.append(text)
+        return text.upper()
+
+    output_path = run_processor(
+        DummyCapture(list(range(len(ocr_results)))),
+        lambda batch: [ocr_results[frame] for frame in batch],
+        verify=fake_verify_text,
+    )
+
+    assert verified == ["Hello world"]
+    content = output_path.read_text(encoding="utf-8").splitlines()
+    assert content == ["ok", "Hello world", "HELLO WORLD", "HELLO WORLD"]
+
+
+def test_video_processor_decodes_shards_in_order(run_processor) -> None:
+    frames = list(range(7))
+    captures: List[DummyCapture] = []
+
+    def open_capture(path: str) -> DummyCapture:
+        captures.append(DummyCapture(frames))
+        return captures[-1]
+
+    output_path = run_processor(open_capture, frame_texts, decode_workers=3)
+
+    assert len(captures) == 3
+    assert all(not capture.opened for capture in captures)
+    content = output_path.read_text(encoding="utf-8").splitlines()
+    assert content == [f"frame text {frame}" for frame in frames]
+
+
+def test_video_processor_samples_frames_at_sample_fps(run_processor) -> None:
+    class SixFpsCapture(DummyCapture):
+        def get(self, prop):
+            if prop == 5:  # cv2.CAP_PROP_FPS
+                return 6.0
+            return super().get(prop)
+
+    ocr_calls: List[int] = []
+
+    def fake_extract_batch(batch):
+        ocr_calls.extend(batch)
+        return frame_texts(batch)
+
+    run_processor(SixFpsCapture(list(range(12))), fake_extract_batch, sample_fps=2.0)
+
+    assert ocr_calls == [0, 3, 6, 9]
+
+
+def test_ocr_size_caps_longest_side() -> None:
+    from src.video_processor import _ocr_size
+
+    assert _ocr_size(1920, 1080, 960) == (960, 540)
+    assert _ocr_size(1080, 1920, 960) == (540, 960)
+    assert _ocr_size(640, 480, 960) == (640, 480)
+    assert _ocr_size(3840, 2160, 0) == (3840, 2160)
+
+
+def test_video_processor_splits_batches_across_ocr_workers(run_processor) -> None:
+    frames = list(range(6))
+    ocr_threads: List[str] = []
+
+    def fake_extract_batch(batch):
+        ocr_threads.append(threading.current_thread().name)
+        return frame_texts(batch)
+
+    output_path = run_processor(
+        DummyCapture(frames), fake_extract_batch, ocr_batch_size=6, ocr_workers=2
+    )
+
+    assert ocr_threads and all(name.startswith("readingrabbit-ocr") for name in ocr_threads)
+    content = output_path.read_text(encoding="utf-8").splitlines()
+    assert content == [f"frame text {frame}" for frame in frames]
+
+
+def test_video_processor_stops_using_a_failing_ocr_pool(run_processor) -> None:
+    frames = list(range(8))
+    worker_calls: List[int] = []
+
+    def fake_extract_batch(batch):
+        if threading.current_thread().name.startswith("readingrabbit-ocr"):
+            worker_calls.append(len(batch))
+            raise RuntimeError("per-thread reader failed")
+        return frame_texts(batch)
+
+    output_path = run_processor(
+        DummyCapture(frames), fake_extract_batch, ocr_batch_size=4, ocr_workers=2
+    )
+
+    assert 0 < len(worker_calls) <= 2  # only the first pooled batch is attempted
+    content = output_path.read_text(encoding="utf-8").splitlines()
+    assert content == [f"frame text {frame}" for frame in frames]
+
+
+def test_video_processor_translates_newlines_like_text_mode(
+    run_processor, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr("src.video_processor.os.linesep", "\r\n")
+
+    output_path = run_processor(
+        DummyCapture([0]), lambda batch: [("first line\nsecond line", 0.9) for _ in batch]
+    )
+
+    assert output_path.read_bytes() == b"first line\r\nsecond line\r\n"
+
+
+def test_video_processor_verifies_queued_captions_in_one_batch(tmp_path: Path) -> None:
+    batches: List[List[str]] = []
+
+    class RecordingSession:
+        available = True
+
+        def verify_batch(self, texts):
+            batches.append(list(texts))
+            return [text.upper() for text in texts]
+
+    results: queue.Queue = queue.Queue()
+    for text in ["Hello world", "Hello world", "ok", "Second caption", "Hello world"]:
+        results.put((None, (text, 0.9)))
+    results.put(_END_OF_STREAM)
+    handle = io.BytesIO()
+    config = AppConfig(video_path="input.mp4", output_text_path=str(tmp_path / "output.txt"))
+    processor = VideoProcessor(config=config, update_callback=lambda *args: None, stop_event=threading.Event())
+
+    errors: List[BaseException] = []
+    processor._write_results(results, handle, RecordingSession(), 5, 0.0, errors)
+
+    assert not errors
+    assert batches == [["Hello world", "Second caption"]]
+    assert handle.getvalue().decode("utf-8").splitlines() == [
+        "HELLO WORLD",
+        "HELLO WORLD",
+        "ok",
+        "SECOND CAPTION",
+        "HELLO WORLD",
+    ]